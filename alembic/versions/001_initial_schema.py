@@ -5,9 +5,10 @@ Revises:
 Create Date: 2025-08-27 15:35:00.000000
 
 """
-from alembic import op
+from alembic import context, op
 import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex, CreateTable
 
 # revision identifiers, used by Alembic.
 revision = '001'
@@ -16,9 +17,11 @@ branch_labels = None
 depends_on = None
 
 
-def upgrade() -> None:
-    # Create users table
-    op.create_table('users',
+# Schema is declared once on a private MetaData so upgrade() can compile the
+# whole DDL script up front and send it in a single round-trip
+metadata = sa.MetaData()
+
+users_table = sa.Table('users', metadata,
     sa.Column('id', sa.Integer(), nullable=False),
     sa.Column('username', sa.String(length=50), nullable=False),
     sa.Column('email', sa.String(length=255), nullable=False),
@@ -28,22 +31,18 @@ def upgrade() -> None:
     sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
     sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
     sa.PrimaryKeyConstraint('id')
-    )
-    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
-    op.create_index(op.f('ix_users_username'), 'users', ['username'], unique=True)
+)
 
-    # Create boards table
-    op.create_table('boards',
+boards_table = sa.Table('boards', metadata,
     sa.Column('id', sa.Integer(), nullable=False),
     sa.Column('name', sa.String(length=255), nullable=False),
     sa.Column('description', sa.Text(), nullable=True),
     sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
     sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
     sa.PrimaryKeyConstraint('id')
-    )
+)
 
-    # Create columns table
-    op.create_table('columns',
+columns_table = sa.Table('columns', metadata,
     sa.Column('id', sa.Integer(), nullable=False),
     sa.Column('name', sa.String(length=100), nullable=False),
     sa.Column('position', sa.Integer(), nullable=False),
@@ -52,12 +51,9 @@ def upgrade() -> None:
     sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
     sa.ForeignKeyConstraint(['board_id'], ['boards.id'], ondelete='CASCADE'),
     sa.PrimaryKeyConstraint('id')
-    )
-    op.create_index(op.f('ix_columns_board_id'), 'columns', ['board_id'])
-    op.create_index(op.f('ix_columns_position'), 'columns', ['position'])
+)
 
-    # Create tasks table
-    op.create_table('tasks',
+tasks_table = sa.Table('tasks', metadata,
     sa.Column('id', sa.Integer(), nullable=False),
     sa.Column('title', sa.String(length=255), nullable=False),
     sa.Column('description', sa.Text(), nullable=True),
@@ -67,9 +63,40 @@ def upgrade() -> None:
     sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
     sa.ForeignKeyConstraint(['column_id'], ['columns.id'], ondelete='CASCADE'),
     sa.PrimaryKeyConstraint('id')
+)
+
+# Ordered so foreign keys resolve: users -> boards -> columns -> tasks
+schema_ddl = [
+    CreateTable(users_table),
+    CreateIndex(sa.Index('ix_users_email', users_table.c.email, unique=True)),
+    CreateIndex(sa.Index('ix_users_username', users_table.c.username, unique=True)),
+    CreateTable(boards_table),
+    CreateTable(columns_table),
+    CreateIndex(sa.Index('ix_columns_board_id', columns_table.c.board_id)),
+    CreateIndex(sa.Index('ix_columns_position', columns_table.c.position)),
+    CreateTable(tasks_table),
+    CreateIndex(sa.Index('ix_tasks_column_id', tasks_table.c.column_id)),
+    CreateIndex(sa.Index('ix_tasks_position', tasks_table.c.position)),
+]
+
+
+def upgrade() -> None:
+    # Offline (--sql) runs have no connection to send a script over, and only
+    # PostgreSQL's driver accepts several statements in one execute; emit the
+    # statements one at a time there
+    if context.is_offline_mode() or op.get_bind().dialect.name != 'postgresql':
+        for statement in schema_ddl:
+            op.execute(statement)
+        return
+
+    # Compile every CREATE TABLE / CREATE INDEX and execute them as one
+    # multi-statement script inside the migration transaction
+    connection = op.get_bind()
+    ddl = ";\n".join(
+        str(statement.compile(dialect=connection.dialect)).strip()
+        for statement in schema_ddl
     )
-    op.create_index(op.f('ix_tasks_column_id'), 'tasks', ['column_id'])
-    op.create_index(op.f('ix_tasks_position'), 'tasks', ['position'])
+    connection.exec_driver_sql(ddl)
 
 
 def downgrade() -> None:
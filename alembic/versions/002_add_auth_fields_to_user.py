@@ -17,64 +17,78 @@ branch_labels = None
 depends_on = None
 
 
-def table_exists(connection, table_name):
-    """Check if a table exists"""
-    result = connection.execute(text("""
-        SELECT EXISTS (
-            SELECT FROM information_schema.tables 
-            WHERE table_name = :table_name
-        )
-    """), {"table_name": table_name})
-    return result.scalar()
+# Built once at import so SQLAlchemy's compiled-statement cache is reused.
+# PostgreSQL probes go straight to pg_catalog; information_schema is a
+# permission-filtered view over the same tables and is much slower.
+_EXISTING_COLUMNS_SQL = text("""
+    SELECT a.attname
+    FROM pg_attribute a
+    WHERE a.attrelid = to_regclass(:table_name)
+      AND a.attnum > 0
+      AND NOT a.attisdropped
+""")
 
+# Columns this revision manages; when all are present there is nothing to do
+AUTH_COLUMNS = {'hashed_password', 'full_name', 'is_active', 'is_admin', 'is_verified'}
 
-def column_exists(connection, table_name, column_name):
-    """Check if a column exists in a table"""
-    result = connection.execute(text("""
-        SELECT COUNT(*) 
-        FROM information_schema.columns 
-        WHERE table_name = :table_name AND column_name = :column_name
-    """), {"table_name": table_name, "column_name": column_name})
-    return result.scalar() > 0
+
+def existing_columns(connection, table_name):
+    """Return the set of column names present on a table (empty if missing)"""
+    if connection.dialect.name == 'sqlite':
+        # PRAGMA does not accept bound parameters; table_name is a literal
+        # from this module, never user input
+        result = connection.exec_driver_sql(f"PRAGMA table_info({table_name})")
+        return {row[1] for row in result}
+    result = connection.execute(_EXISTING_COLUMNS_SQL, {"table_name": table_name})
+    return {row[0] for row in result}
 
 
 def upgrade() -> None:
-    # Get connection to check existing tables and columns
+    # Get connection to check existing columns
     connection = op.get_bind()
     
+    # Fetch the current column set once instead of probing per column;
+    # a missing users table yields an empty set
+    columns = existing_columns(connection, 'users')
+    
     # Only proceed if users table exists
-    if not table_exists(connection, 'users'):
+    if not columns:
         print("Users table does not exist, skipping auth field additions")
         return
     
+    # Fast path for already-migrated databases: one query, no DDL
+    if AUTH_COLUMNS <= columns:
+        return
+    
     # Add columns only if they don't exist
     # Skip hashed_password as it's already in migration 001
     
-    if not column_exists(connection, 'users', 'full_name'):
+    if 'full_name' not in columns:
         op.add_column('users', sa.Column('full_name', sa.String(), nullable=True))
     
     # Skip is_active and is_admin as they're already in migration 001
     
-    if not column_exists(connection, 'users', 'is_verified'):
+    if 'is_verified' not in columns:
         op.add_column('users', sa.Column('is_verified', sa.Boolean(), nullable=False, server_default='false'))
 
 
 def downgrade() -> None:
     # Get connection to check existing columns
     connection = op.get_bind()
+    columns = existing_columns(connection, 'users')
     
     # Drop columns only if they exist
-    if column_exists(connection, 'users', 'is_verified'):
+    if 'is_verified' in columns:
         op.drop_column('users', 'is_verified')
     
-    if column_exists(connection, 'users', 'is_admin'):
+    if 'is_admin' in columns:
         op.drop_column('users', 'is_admin')
     
-    if column_exists(connection, 'users', 'is_active'):
+    if 'is_active' in columns:
         op.drop_column('users', 'is_active')
     
-    if column_exists(connection, 'users', 'full_name'):
+    if 'full_name' in columns:
         op.drop_column('users', 'full_name')
     
-    if column_exists(connection, 'users', 'hashed_password'):
+    if 'hashed_password' in columns:
         op.drop_column('users', 'hashed_password')
@@ -7,6 +7,7 @@ Create Date: 2025-09-05 19:13:00.000000
 """
 from alembic import op
 import sqlalchemy as sa
+from src.migrations.ddl import set_ddl_timeouts
 
 
 # revision identifiers, used by Alembic.
@@ -17,14 +18,20 @@ depends_on = None
 
 
 def upgrade():
+    set_ddl_timeouts()
+    
     # Make hashed_password column nullable to support OIDC-only users
-    op.alter_column('users', 'hashed_password',
-                    existing_type=sa.VARCHAR(length=255),
-                    nullable=True)
+    # batch_alter_table emits dialect-appropriate DDL: a metadata-only ALTER
+    # on PostgreSQL, copy-and-move on SQLite
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.alter_column('hashed_password',
+                              existing_type=sa.VARCHAR(length=255),
+                              nullable=True)
 
 
 def downgrade():
     # Revert hashed_password column to not nullable
-    op.alter_column('users', 'hashed_password',
-                    existing_type=sa.VARCHAR(length=255),
-                    nullable=False)
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.alter_column('hashed_password',
+                              existing_type=sa.VARCHAR(length=255),
+                              nullable=False)
@@ -9,6 +9,8 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy import text
+from src.migrations.ddl import ddl_autocommit_block, set_ddl_timeouts
 
 
 # revision identifiers, used by Alembic.
@@ -18,33 +20,94 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+BACKFILL_BATCH_SIZE = 1000
+
+_DEFAULT_OWNER_SQL = text("SELECT id FROM users ORDER BY id LIMIT 1")
+
+_BACKFILL_OWNER_SQL = text("""
+    WITH batch AS (
+        SELECT id FROM boards
+        WHERE owner_id IS NULL
+        LIMIT :batch_size
+        FOR UPDATE SKIP LOCKED
+    )
+    UPDATE boards SET owner_id = :owner_id
+    FROM batch
+    WHERE boards.id = batch.id
+""")
+
+
+def backfill_owner_ids(connection):
+    """Assign boards without an owner to the first user, one batch at a time"""
+    default_owner = connection.execute(_DEFAULT_OWNER_SQL).scalar()
+    if default_owner is None:
+        return
+
+    while True:
+        result = connection.execute(
+            _BACKFILL_OWNER_SQL,
+            {"owner_id": default_owner, "batch_size": BACKFILL_BATCH_SIZE},
+        )
+        if not result.rowcount:
+            break
+
+
+def set_owner_id_not_null():
+    """Make boards.owner_id NOT NULL without a long exclusive-lock scan.
+
+    A NOT VALID check constraint is added under a brief lock and validated
+    under SHARE UPDATE EXCLUSIVE. PostgreSQL 12+ then skips the table scan
+    for SET NOT NULL because the validated check already proves it.
+    """
+    op.execute("""
+        ALTER TABLE boards
+        ADD CONSTRAINT boards_owner_id_not_null
+        CHECK (owner_id IS NOT NULL) NOT VALID
+    """)
+    with ddl_autocommit_block():
+        op.execute("ALTER TABLE boards VALIDATE CONSTRAINT boards_owner_id_not_null")
+    op.alter_column('boards', 'owner_id', nullable=False)
+    op.execute("ALTER TABLE boards DROP CONSTRAINT boards_owner_id_not_null")
+
+
 def upgrade() -> None:
+    set_ddl_timeouts()
+    
     # Add owner_id column to boards table (nullable initially)
     op.add_column('boards', sa.Column('owner_id', sa.Integer(), nullable=True))
     
     # Assign existing boards to the first available user
     # This ensures existing boards don't vanish
-    op.execute("""
-        UPDATE boards 
-        SET owner_id = (SELECT id FROM users ORDER BY id LIMIT 1) 
-        WHERE owner_id IS NULL
-    """)
+    # Backfill in bounded batches, committing each one, so a large boards
+    # table never holds one huge row-lock set or transaction
+    with ddl_autocommit_block():
+        backfill_owner_ids(op.get_bind())
     
     # Make owner_id non-nullable now that all boards have owners
-    op.alter_column('boards', 'owner_id', nullable=False)
+    set_owner_id_not_null()
     
-    # Add foreign key constraint
-    op.create_foreign_key(
-        'fk_boards_owner_id', 
-        'boards', 
-        'users', 
-        ['owner_id'], 
-        ['id'], 
-        ondelete='CASCADE'
-    )
+    # Create index for performance. CONCURRENTLY avoids blocking writes to
+    # boards during the build but cannot run inside a transaction.
+    # boards has no soft-delete column to filter a partial index on, so
+    # INCLUDE (name) instead lets owner board listings be index-only scans.
+    with ddl_autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_boards_owner_id "
+            "ON boards (owner_id) INCLUDE (name)"
+        )
     
-    # Create index for performance
-    op.create_index('ix_boards_owner_id', 'boards', ['owner_id'])
+    # Add foreign key constraint without the initial full-table check, then
+    # validate it separately under a weaker lock that allows concurrent DML.
+    # The index above must exist first so validation can use it. VALIDATE
+    # runs in its own transaction so the SHARE ROW EXCLUSIVE locks taken by
+    # ADD on boards and users are released before the validation scan.
+    op.execute("""
+        ALTER TABLE boards
+        ADD CONSTRAINT fk_boards_owner_id FOREIGN KEY (owner_id)
+        REFERENCES users (id) ON DELETE CASCADE NOT VALID
+    """)
+    with ddl_autocommit_block():
+        op.execute("ALTER TABLE boards VALIDATE CONSTRAINT fk_boards_owner_id")
 
 
 def downgrade() -> None:
@@ -9,6 +9,8 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy import text
+from src.migrations.ddl import ddl_autocommit_block, set_ddl_timeouts
 
 
 # revision identifiers, used by Alembic.
@@ -18,19 +20,84 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+BACKFILL_BATCH_SIZE = 1000
+
+_OWNER_ID_NOT_NULL_SQL = text("""
+    SELECT a.attnotnull
+    FROM pg_attribute a
+    WHERE a.attrelid = to_regclass('boards')
+      AND a.attname = 'owner_id'
+      AND NOT a.attisdropped
+""")
+
+_DEFAULT_OWNER_SQL = text("SELECT id FROM users ORDER BY id LIMIT 1")
+
+_BACKFILL_OWNER_SQL = text("""
+    WITH batch AS (
+        SELECT id FROM boards
+        WHERE owner_id IS NULL
+        LIMIT :batch_size
+        FOR UPDATE SKIP LOCKED
+    )
+    UPDATE boards SET owner_id = :owner_id
+    FROM batch
+    WHERE boards.id = batch.id
+""")
+
+
+def backfill_owner_ids(connection):
+    """Assign boards without an owner to the first user, one batch at a time"""
+    default_owner = connection.execute(_DEFAULT_OWNER_SQL).scalar()
+    if default_owner is None:
+        return
+
+    while True:
+        result = connection.execute(
+            _BACKFILL_OWNER_SQL,
+            {"owner_id": default_owner, "batch_size": BACKFILL_BATCH_SIZE},
+        )
+        if not result.rowcount:
+            break
+
+
+def set_owner_id_not_null():
+    """Make boards.owner_id NOT NULL without a long exclusive-lock scan.
+
+    A NOT VALID check constraint is added under a brief lock and validated
+    under SHARE UPDATE EXCLUSIVE. PostgreSQL 12+ then skips the table scan
+    for SET NOT NULL because the validated check already proves it.
+    """
+    op.execute("""
+        ALTER TABLE boards
+        ADD CONSTRAINT boards_owner_id_not_null
+        CHECK (owner_id IS NOT NULL) NOT VALID
+    """)
+    with ddl_autocommit_block():
+        op.execute("ALTER TABLE boards VALIDATE CONSTRAINT boards_owner_id_not_null")
+    op.alter_column('boards', 'owner_id', nullable=False)
+    op.execute("ALTER TABLE boards DROP CONSTRAINT boards_owner_id_not_null")
+
+
 def upgrade() -> None:
+    # 005 now backfills and sets NOT NULL itself, so this revision only has
+    # work to do on databases migrated by the original, buggy 005
+    if op.get_bind().execute(_OWNER_ID_NOT_NULL_SQL).scalar():
+        return
+    
+    set_ddl_timeouts()
+    
     # Assign existing boards with NULL owner_id to the first available user
     # This ensures existing boards don't vanish
-    op.execute("""
-        UPDATE boards 
-        SET owner_id = (SELECT id FROM users ORDER BY id LIMIT 1) 
-        WHERE owner_id IS NULL
-    """)
+    # Backfill in bounded batches, committing each one, so a large boards
+    # table never holds one huge row-lock set or transaction
+    with ddl_autocommit_block():
+        backfill_owner_ids(op.get_bind())
     
     # Make owner_id non-nullable now that all boards have owners
-    op.alter_column('boards', 'owner_id', nullable=False)
+    set_owner_id_not_null()
 
 
 def downgrade() -> None:
-    # Make owner_id nullable again
-    op.alter_column('boards', 'owner_id', nullable=True)
+    # owner_id is NOT NULL at revision 005 as well, so there is nothing to
+    # revert; 005's downgrade drops the column
+    pass
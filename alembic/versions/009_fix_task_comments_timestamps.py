@@ -7,6 +7,8 @@ Create Date: 2025-09-06 15:45:00.000000
 """
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy import text
+from src.migrations.ddl import ddl_autocommit_block, set_ddl_timeouts
 
 
 # revision identifiers, used by Alembic.
@@ -16,34 +18,59 @@ branch_labels = None
 depends_on = None
 
 
+BACKFILL_BATCH_SIZE = 1000
+
+TIMESTAMP_COLUMNS = ('created_at', 'updated_at')
+
+_BACKFILL_TIMESTAMP_SQL = {
+    column_name: text(f"""
+        WITH batch AS (
+            SELECT id FROM task_comments
+            WHERE {column_name} IS NULL
+            LIMIT :batch_size
+            FOR UPDATE SKIP LOCKED
+        )
+        UPDATE task_comments SET {column_name} = now()
+        FROM batch
+        WHERE task_comments.id = batch.id
+    """)
+    for column_name in TIMESTAMP_COLUMNS
+}
+
+
+def backfill_timestamp(connection, column_name):
+    """Populate NULL timestamps on task_comments one batch at a time"""
+    while True:
+        result = connection.execute(
+            _BACKFILL_TIMESTAMP_SQL[column_name],
+            {"batch_size": BACKFILL_BATCH_SIZE},
+        )
+        if not result.rowcount:
+            break
+
+
 def upgrade() -> None:
     """Fix task_comments table timestamps."""
-    # Drop and recreate the table with proper timestamp defaults
-    op.drop_table('task_comments')
-    op.create_table('task_comments',
-        sa.Column('id', sa.Integer(), nullable=False),
-        sa.Column('content', sa.Text(), nullable=False),
-        sa.Column('task_id', sa.Integer(), nullable=False),
-        sa.Column('author_id', sa.Integer(), nullable=False),
-        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
-        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
-        sa.ForeignKeyConstraint(['author_id'], ['users.id'], ondelete='CASCADE'),
-        sa.ForeignKeyConstraint(['task_id'], ['tasks.id'], ondelete='CASCADE'),
-        sa.PrimaryKeyConstraint('id')
-    )
+    set_ddl_timeouts()
+    
+    # Alter the timestamp columns in place instead of recreating the table,
+    # which would discard existing comments and rewrite the table file.
+    # Any NULLs are backfilled in committed batches before SET NOT NULL.
+    with ddl_autocommit_block():
+        for column_name in TIMESTAMP_COLUMNS:
+            backfill_timestamp(op.get_bind(), column_name)
+
+    for column_name in TIMESTAMP_COLUMNS:
+        op.alter_column('task_comments', column_name,
+                        existing_type=sa.DateTime(timezone=True),
+                        server_default=sa.func.now(),
+                        nullable=False)
 
 
 def downgrade() -> None:
     """Revert task_comments table timestamps."""
-    op.drop_table('task_comments')
-    op.create_table('task_comments',
-        sa.Column('id', sa.Integer(), nullable=False),
-        sa.Column('content', sa.Text(), nullable=False),
-        sa.Column('task_id', sa.Integer(), nullable=False),
-        sa.Column('author_id', sa.Integer(), nullable=False),
-        sa.Column('created_at', sa.DateTime(), nullable=False),
-        sa.Column('updated_at', sa.DateTime(), nullable=False),
-        sa.ForeignKeyConstraint(['author_id'], ['users.id'], ondelete='CASCADE'),
-        sa.ForeignKeyConstraint(['task_id'], ['tasks.id'], ondelete='CASCADE'),
-        sa.PrimaryKeyConstraint('id')
-    )
+    for column_name in TIMESTAMP_COLUMNS:
+        op.alter_column('task_comments', column_name,
+                        existing_type=sa.DateTime(timezone=True),
+                        server_default=None,
+                        existing_nullable=False)
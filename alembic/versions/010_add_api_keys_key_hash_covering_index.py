@@ -0,0 +1,52 @@
+"""Add covering index for API key lookup by hash
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import text
+
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+
+_TABLE_EXISTS_SQL = text("SELECT to_regclass('public.api_keys') IS NOT NULL")
+
+
+def upgrade() -> None:
+    """Create a covering partial index for active API key lookups."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # api_keys is created from the models at application startup, so on a
+    # fresh database it may not exist yet; the model declares the same index
+    if not op.get_bind().execute(_TABLE_EXISTS_SQL).scalar():
+        return
+
+    # INCLUDE lets authentication resolve a key with an index-only scan, and
+    # the WHERE clause keeps revoked keys out of the tree
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_api_keys_key_hash_covering
+            ON api_keys (key_hash)
+            INCLUDE (id, name, is_active, user_id, expires_at, scopes)
+            WHERE is_active
+        """)
+
+
+def downgrade() -> None:
+    """Drop the covering API key index."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS ix_api_keys_key_hash_covering"
+        )
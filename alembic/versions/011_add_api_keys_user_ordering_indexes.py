@@ -0,0 +1,52 @@
+"""Add per-user ordering indexes on api_keys
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import text
+
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+
+_TABLE_EXISTS_SQL = text("SELECT to_regclass('public.api_keys') IS NOT NULL")
+
+INDEXES = {
+    'ix_api_keys_user_id_created_at': '(user_id, created_at)',
+    'ix_api_keys_user_id_usage_count': '(user_id, usage_count)',
+}
+
+
+def upgrade() -> None:
+    """Index api_keys by owner plus the columns the endpoints order by."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # api_keys is created from the models at application startup, so on a
+    # fresh database it may not exist yet; the model declares the same indexes
+    if not op.get_bind().execute(_TABLE_EXISTS_SQL).scalar():
+        return
+
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES.items():
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON api_keys {columns}"
+            )
+
+
+def downgrade() -> None:
+    """Drop the per-user ordering indexes."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    with op.get_context().autocommit_block():
+        for name in INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
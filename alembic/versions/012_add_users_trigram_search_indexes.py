@@ -0,0 +1,48 @@
+"""Add trigram indexes for user search
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+
+# User search matches ILIKE '%term%', which a b-tree cannot serve; trigram GIN
+# indexes can. Only active users are searchable, so the indexes are partial.
+TRIGRAM_INDEXES = {
+    'ix_users_email_trgm': 'email',
+    'ix_users_username_trgm': 'username',
+}
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    with op.get_context().autocommit_block():
+        for name, column in TRIGRAM_INDEXES.items():
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON users USING gin ({column} gin_trgm_ops) WHERE is_active"
+            )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # pg_trgm is left installed; other objects may depend on it
+    with op.get_context().autocommit_block():
+        for name in TRIGRAM_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,43 @@
+"""Add composite position indexes on columns and tasks
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+
+# Board reads load columns by board and tasks by column, ordered by position
+INDEXES = {
+    'ix_columns_board_id_position': ('columns', '(board_id, position)'),
+    'ix_tasks_column_id_position': ('tasks', '(column_id, position)'),
+}
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    with op.get_context().autocommit_block():
+        for name, (table, columns) in INDEXES.items():
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} {columns}"
+            )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    with op.get_context().autocommit_block():
+        for name in INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
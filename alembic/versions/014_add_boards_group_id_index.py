@@ -0,0 +1,53 @@
+"""Add index on boards.group_id
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import text
+
+
+# revision identifiers, used by Alembic.
+revision = '014'
+down_revision = '013'
+branch_labels = None
+depends_on = None
+
+
+# pg_catalog rather than information_schema, like the other column probes
+_COLUMN_EXISTS_SQL = text("""
+    SELECT 1
+    FROM pg_attribute a
+    WHERE a.attrelid = to_regclass('boards')
+      AND a.attname = 'group_id'
+      AND NOT a.attisdropped
+""")
+
+
+def upgrade() -> None:
+    """Index boards.group_id so board listings can probe group ownership."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # group_id is added by the group migration at application startup, so on
+    # a fresh database it may not exist yet; the model declares the index
+    if op.get_bind().execute(_COLUMN_EXISTS_SQL).first() is None:
+        return
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_boards_group_id "
+            "ON boards (group_id)"
+        )
+
+
+def downgrade() -> None:
+    """Drop the boards.group_id index."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_boards_group_id")
@@ -0,0 +1,95 @@
+"""Add unique index on user_groups (group_id, user_id)
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+import logging
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import text
+from src.migrations.ddl import ddl_autocommit_block, set_ddl_timeouts
+
+
+# revision identifiers, used by Alembic.
+revision = '015'
+down_revision = '014'
+branch_labels = None
+depends_on = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+
+INDEX_NAME = 'uq_user_groups_group_id_user_id'
+
+_TABLE_EXISTS_SQL = text("SELECT to_regclass('public.user_groups') IS NOT NULL")
+
+# Keep one row per membership: the highest role, then the oldest row. Roles
+# are ranked explicitly rather than by the grouprole type's declaration order
+_DELETE_DUPLICATES_SQL = text("""
+    DELETE FROM user_groups
+    WHERE id IN (
+        SELECT id FROM (
+            SELECT id, row_number() OVER (
+                PARTITION BY group_id, user_id
+                ORDER BY CASE role::text
+                    WHEN 'OWNER' THEN 0
+                    WHEN 'ADMIN' THEN 1
+                    ELSE 2
+                END, id
+            ) AS rn
+            FROM user_groups
+        ) ranked
+        WHERE rn > 1
+    )
+    RETURNING id, group_id, user_id, role::text AS role
+""")
+
+# A failed CREATE INDEX CONCURRENTLY leaves an invalid index behind, which
+# IF NOT EXISTS would then silently accept
+_INVALID_INDEX_SQL = text("""
+    SELECT NOT i.indisvalid
+    FROM pg_index i
+    WHERE i.indexrelid = to_regclass(:index_name)
+""")
+
+
+def upgrade() -> None:
+    """Make a user a member of a group at most once."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # user_groups is created from the models at application startup, so on a
+    # fresh database it may not exist yet; the model declares the same index
+    if not op.get_bind().execute(_TABLE_EXISTS_SQL).scalar():
+        return
+
+    set_ddl_timeouts()
+    for row in op.get_bind().execute(_DELETE_DUPLICATES_SQL):
+        logger.warning(
+            "Removed duplicate membership %s of user %s in group %s (role %s)",
+            row.id, row.user_id, row.group_id, row.role,
+        )
+
+    invalid = op.get_bind().execute(
+        _INVALID_INDEX_SQL, {"index_name": f"public.{INDEX_NAME}"}
+    ).scalar()
+
+    with ddl_autocommit_block():
+        if invalid:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}")
+        op.execute(
+            f"CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} "
+            "ON user_groups (group_id, user_id)"
+        )
+
+
+def downgrade() -> None:
+    """Drop the unique membership index."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    with ddl_autocommit_block():
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}")
@@ -4,14 +4,93 @@ Debug script to check API key database status and authentication.
 """
 import os
 import sys
+import json
 import hashlib
 import asyncio
-from sqlalchemy.ext.asyncio import create_async_engine
-from sqlalchemy import text
+import asyncpg
+
+from src.utils.db_url import to_asyncpg_dsn
 
 # Test API key - should be retrieved from Kubernetes secret in production
 TEST_API_KEY = "sk_***REDACTED***"  # Replace with actual key from kubectl get secret
 
+# Derived once at import; matches ApiKey.hash_key() / ApiKey.get_prefix()
+TEST_KEY_HASH = hashlib.sha256(TEST_API_KEY.encode()).hexdigest()
+TEST_KEY_PREFIX = TEST_API_KEY[:8]
+
+# Statements use stable text so asyncpg's per-connection prepared statement
+# cache serves repeat executions without a server-side re-parse
+SQL_STMTS = {
+    # Phases 1-4 (table exists, columns, key count, recent keys) fused into
+    # one round-trip and returned as a single JSON document. If api_keys is
+    # missing the statement fails to plan with UndefinedTable.
+    "overview": """
+        SELECT jsonb_build_object(
+            'columns', cols.columns,
+            'count', n.total,
+            'keys', recent.keys
+        )::text
+        FROM (
+            SELECT COALESCE(
+                jsonb_agg(
+                    jsonb_build_array(
+                        a.attname,
+                        format_type(a.atttypid, a.atttypmod),
+                        CASE WHEN a.attnotnull THEN 'NO' ELSE 'YES' END
+                    )
+                    ORDER BY a.attnum
+                ),
+                '[]'::jsonb
+            ) AS columns
+            FROM pg_attribute a
+            WHERE a.attrelid = to_regclass('public.api_keys')
+              AND a.attnum > 0
+              AND NOT a.attisdropped
+        ) cols,
+        (SELECT COUNT(*) AS total FROM api_keys) n,
+        (
+            SELECT COALESCE(
+                jsonb_agg(
+                    jsonb_build_array(
+                        k.id, k.name, k.key_prefix, k.is_active, k.user_id,
+                        to_char(k.expires_at, 'YYYY-MM-DD')
+                    )
+                    ORDER BY k.created_at DESC
+                ),
+                '[]'::jsonb
+            ) AS keys
+            FROM (
+                SELECT id, name, key_prefix, is_active, user_id, expires_at, created_at
+                FROM api_keys
+                ORDER BY created_at DESC
+                LIMIT 10
+            ) k
+        ) recent;
+    """,
+    "list_tables": """
+        SELECT c.relname
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = 'public' AND c.relkind IN ('r', 'p')
+        ORDER BY c.relname;
+    """,
+    "key_by_hash": """
+        SELECT id, name, is_active, user_id, expires_at, scopes
+        FROM api_keys 
+        WHERE key_hash = $1;
+    """,
+    "key_by_prefix": """
+        SELECT id, name, key_prefix, is_active
+        FROM api_keys 
+        WHERE key_prefix = $1;
+    """,
+    "user_by_id": """
+        SELECT id, username, is_active
+        FROM users 
+        WHERE id = $1;
+    """,
+}
+
 async def debug_api_keys():
     """Debug API key database and authentication."""
     print("🔍 Debugging API Key System")
@@ -25,36 +104,25 @@ async def debug_api_keys():
     
     print(f"📊 Database URL: {database_url}")
     
-    # Convert to async URL
-    if database_url.startswith("postgresql://"):
-        async_url = database_url.replace("postgresql://", "postgresql+asyncpg://")
-    else:
-        async_url = database_url
+    # asyncpg expects a plain libpq DSN, so drop any SQLAlchemy driver suffix
+    dsn = to_asyncpg_dsn(database_url)
     
     try:
-        engine = create_async_engine(async_url)
-        async with engine.begin() as conn:
-            # Check if api_keys table exists
+        conn = await asyncpg.connect(dsn)
+        try:
+            # Phases 1-4 come back from a single fused query
             print("\n1️⃣ Checking if api_keys table exists...")
-            result = await conn.execute(text("""
-                SELECT table_name 
-                FROM information_schema.tables 
-                WHERE table_schema = 'public' AND table_name = 'api_keys';
-            """))
-            table_exists = result.fetchone()
-            
-            if not table_exists:
+            try:
+                overview = json.loads(await conn.fetchval(SQL_STMTS["overview"]))
+            except asyncpg.UndefinedTableError:
+                overview = None
+            
+            if overview is None:
                 print("❌ api_keys table does not exist!")
                 print("💡 The table needs to be created. This might be why API keys aren't working.")
-                
+            
                 # Show all existing tables
-                result = await conn.execute(text("""
-                    SELECT table_name 
-                    FROM information_schema.tables 
-                    WHERE table_schema = 'public' 
-                    ORDER BY table_name;
-                """))
-                tables = result.fetchall()
+                tables = await conn.fetch(SQL_STMTS["list_tables"])
                 print(f"\n📋 Existing tables ({len(tables)}):")
                 for table in tables:
                     print(f"   - {table[0]}")
@@ -62,23 +130,14 @@ async def debug_api_keys():
             
             print("✅ api_keys table exists!")
             
-            # Check table structure
             print("\n2️⃣ Checking api_keys table structure...")
-            result = await conn.execute(text("""
-                SELECT column_name, data_type, is_nullable
-                FROM information_schema.columns 
-                WHERE table_name = 'api_keys' 
-                ORDER BY ordinal_position;
-            """))
-            columns = result.fetchall()
             print("📋 Table columns:")
-            for col in columns:
+            for col in overview["columns"]:
                 print(f"   - {col[0]} ({col[1]}) {'NULL' if col[2] == 'YES' else 'NOT NULL'}")
             
             # Check number of API keys
             print("\n3️⃣ Checking API key count...")
-            result = await conn.execute(text("SELECT COUNT(*) FROM api_keys;"))
-            count = result.scalar()
+            count = overview["count"]
             print(f"📊 Total API keys in database: {count}")
             
             if count == 0:
@@ -88,54 +147,36 @@ async def debug_api_keys():
             
             # Show existing API keys (without sensitive data)
             print("\n4️⃣ Listing existing API keys...")
-            result = await conn.execute(text("""
-                SELECT id, name, key_prefix, is_active, user_id, expires_at, created_at
-                FROM api_keys 
-                ORDER BY created_at DESC 
-                LIMIT 10;
-            """))
-            keys = result.fetchall()
-            
             print("🔑 API Keys:")
-            for key in keys:
+            for key in overview["keys"]:
                 status = "🟢 Active" if key[3] else "🔴 Inactive"
-                expires = key[5].strftime("%Y-%m-%d") if key[5] else "Never"
+                expires = key[5] or "Never"
                 print(f"   ID: {key[0]} | Name: {key[1]} | Prefix: {key[2]} | {status} | User: {key[4]} | Expires: {expires}")
             
             # Check if the provided API key exists
             print(f"\n5️⃣ Checking provided API key: {TEST_API_KEY[:20]}...")
-            key_hash = hashlib.sha256(TEST_API_KEY.encode()).hexdigest()
-            key_prefix = TEST_API_KEY[:8]
+            key_hash = TEST_KEY_HASH
+            key_prefix = TEST_KEY_PREFIX
             
             print(f"🔐 Key hash: {key_hash}")
             print(f"🏷️  Key prefix: {key_prefix}")
             
-            result = await conn.execute(text("""
-                SELECT id, name, is_active, user_id, expires_at, scopes
-                FROM api_keys 
-                WHERE key_hash = :key_hash;
-            """), {"key_hash": key_hash})
-            
-            matching_key = result.fetchone()
+            matching_key = await conn.fetchrow(SQL_STMTS["key_by_hash"], key_hash)
             
             if not matching_key:
                 print("❌ Provided API key not found in database!")
                 print("💡 The API key either doesn't exist or the hash doesn't match.")
-                
+            
                 # Check if there's a key with matching prefix
-                result = await conn.execute(text("""
-                    SELECT id, name, key_prefix, is_active
-                    FROM api_keys 
-                    WHERE key_prefix = :key_prefix;
-                """), {"key_prefix": key_prefix})
-                
-                prefix_match = result.fetchone()
+                prefix_match = await conn.fetchrow(
+                    SQL_STMTS["key_by_prefix"], key_prefix
+                )
                 if prefix_match:
                     print(f"🔍 Found API key with matching prefix: ID {prefix_match[0]}, Name: {prefix_match[1]}")
                     print("💡 This suggests the key exists but the hash doesn't match (key might be different).")
                 else:
                     print("🔍 No API key found with matching prefix either.")
-                
+            
                 return
             
             print("✅ API key found in database!")
@@ -160,13 +201,7 @@ async def debug_api_keys():
             
             # Check if user exists and is active
             print(f"\n6️⃣ Checking user {matching_key[3]}...")
-            result = await conn.execute(text("""
-                SELECT id, username, is_active
-                FROM users 
-                WHERE id = :user_id;
-            """), {"user_id": matching_key[3]})
-            
-            user = result.fetchone()
+            user = await conn.fetchrow(SQL_STMTS["user_by_id"], matching_key[3])
             if not user:
                 print("❌ User associated with API key not found!")
                 return
@@ -180,6 +215,8 @@ async def debug_api_keys():
             
             print("\n🎉 API key appears to be valid in database!")
             print("💡 The issue might be in the authentication middleware or request handling.")
+        finally:
+            await conn.close()
             
     except Exception as e:
         print(f"❌ Database connection error: {e}")
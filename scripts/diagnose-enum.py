@@ -13,6 +13,11 @@ import sys
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy import text
 
+# Allow running as `python scripts/diagnose-enum.py` from the repo root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.db_url import to_async_pg
+
 async def diagnose_enum_issue():
     """Diagnose the grouprole enum issue."""
     
@@ -22,8 +27,9 @@ async def diagnose_enum_issue():
         print("❌ DATABASE_URL not found in environment")
         return
     
-    # Create async engine
-    engine = create_async_engine(database_url, echo=False)
+    # Create async engine; a plain postgresql:// URL would select the sync
+    # psycopg2 driver, which create_async_engine rejects
+    engine = create_async_engine(to_async_pg(database_url), echo=False)
     
     try:
         async with engine.begin() as conn:
@@ -83,15 +89,22 @@ async def diagnose_enum_issue():
             
             # 3. Check user_groups table structure
             print("\n3. Checking user_groups table structure:")
-            table_info = await conn.execute(text("""
-                SELECT column_name, data_type, udt_name, is_nullable
-                FROM information_schema.columns
-                WHERE table_name = 'user_groups'
-                ORDER BY ordinal_position;
-            """))
+            # to_regclass is a single catalog cache lookup, far cheaper
+            # than filtering the information_schema views
+            table_check = await conn.execute(
+                text("SELECT to_regclass('public.user_groups') IS NOT NULL")
+            )
+            user_groups_exists = table_check.scalar()
             
-            columns = table_info.fetchall()
-            if columns:
+            if user_groups_exists:
+                table_info = await conn.execute(text("""
+                    SELECT column_name, data_type, udt_name, is_nullable
+                    FROM information_schema.columns
+                    WHERE table_name = 'user_groups'
+                    ORDER BY ordinal_position;
+                """))
+                
+                columns = table_info.fetchall()
                 print("   Columns:")
                 for col in columns:
                     print(f"     - {col.column_name}: {col.data_type} ({col.udt_name}) nullable={col.is_nullable}")
@@ -100,20 +113,23 @@ async def diagnose_enum_issue():
             
             # 4. Check existing data in user_groups
             print("\n4. Checking existing user_groups data:")
-            existing_data = await conn.execute(text("""
-                SELECT id, user_id, group_id, role, created_at
-                FROM user_groups
-                ORDER BY id
-                LIMIT 5;
-            """))
-            
-            rows = existing_data.fetchall()
-            if rows:
-                print("   Existing records:")
-                for row in rows:
-                    print(f"     - ID {row.id}: User {row.user_id} -> Group {row.group_id}, Role: '{row.role}'")
+            if user_groups_exists:
+                existing_data = await conn.execute(text("""
+                    SELECT id, user_id, group_id, role, created_at
+                    FROM user_groups
+                    ORDER BY id
+                    LIMIT 5;
+                """))
+                
+                rows = existing_data.fetchall()
+                if rows:
+                    print("   Existing records:")
+                    for row in rows:
+                        print(f"     - ID {row.id}: User {row.user_id} -> Group {row.group_id}, Role: '{row.role}'")
+                else:
+                    print("   ℹ️  No existing records in user_groups table")
             else:
-                print("   ℹ️  No existing records in user_groups table")
+                print("   ⏭️  Skipped, user_groups table not found")
             
             # 5. Try to understand the constraint
             print("\n5. Checking constraints on role column:")
@@ -7,36 +7,118 @@ Provides administrative functionality for managing users, including:
 - Granting/revoking admin privileges
 """
 
-from typing import List, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, status
+import logging
+from typing import List, Dict, Any, Optional
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import ORJSONResponse
+from fastapi.security import HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, func, update, exists
+from sqlalchemy.orm import aliased, raiseload
 
 from ..database import get_db_session
-from ..auth.dependencies import get_current_user, get_user_from_api_key_or_jwt
+from ..middleware import admin_stats_rate_limiter
+from ..auth import session_service
+from ..auth.dependencies import (
+    admin_user_cache,
+    get_current_user,
+    get_request_token,
+    get_user_from_api_key_or_jwt,
+    invalidate_cached_user,
+    security,
+)
 from ..models.user import User
 from ..models.board import Board
 from ..models.column import Column
 from ..models.task import Task
 from ..schemas.admin import UserStatsResponse, UserUpdateRequest
 
-router = APIRouter(prefix="/admin", tags=["admin"])
+router = APIRouter(
+    prefix="/admin", tags=["admin"], default_response_class=ORJSONResponse
+)
+logger = logging.getLogger(__name__)
+
+# Dashboard stats are polled by every open admin page, so they are cached in
+# Redis. The stale copy outlives the fresh one and is only served when the
+# database query fails.
+ADMIN_STATS_CACHE_KEY = "admin:stats:v1"
+ADMIN_STATS_STALE_KEY = "admin:stats:stale"
+ADMIN_STATS_TTL_SECONDS = 60
+ADMIN_STATS_STALE_TTL_SECONDS = 3600
+
+
+async def _get_cached_stats(redis_client, key: str) -> Optional[Dict[str, Any]]:
+    """Read a cached stats payload, treating Redis errors as a miss."""
+    if redis_client is None:
+        return None
+    try:
+        cached = await redis_client.get(key)
+    except Exception as e:
+        logger.warning(f"Could not read {key} from Redis: {e}")
+        return None
+    return orjson.loads(cached) if cached else None
+
+
+async def _set_cached_stats(redis_client, stats: Dict[str, Any]) -> None:
+    """Store fresh and stale copies of the stats payload."""
+    if redis_client is None:
+        return
+    payload = orjson.dumps(stats)
+    try:
+        await redis_client.setex(
+            ADMIN_STATS_CACHE_KEY, ADMIN_STATS_TTL_SECONDS, payload
+        )
+        await redis_client.setex(
+            ADMIN_STATS_STALE_KEY, ADMIN_STATS_STALE_TTL_SECONDS, payload
+        )
+    except Exception as e:
+        logger.warning(f"Could not cache admin stats in Redis: {e}")
 
 
 async def get_admin_user(
-    current_user: User = Depends(get_user_from_api_key_or_jwt),
+    request: Request,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+    db: AsyncSession = Depends(get_db_session),
 ) -> User:
     """
     Dependency to ensure the current user is an admin.
     Initially allows user ID 1, later will check is_admin flag.
+
+    Successful checks for JWT logins are cached briefly per token so repeated
+    dashboard requests skip token verification and the user lookup. API key
+    requests are never cached so their usage is always recorded.
     """
+    token = get_request_token(request, credentials)
+    cache_key = session_service.hash_token(token) if token else None
+    if cache_key:
+        cached_admin = admin_user_cache.get(cache_key)
+        if cached_admin is not None:
+            return cached_admin
+
+    current_user = await get_user_from_api_key_or_jwt(request, credentials, db)
+
     # For now, only allow user ID 1 (the initial admin)
     # Later this will be expanded to check is_admin flag
     if current_user.id != 1 and not current_user.is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required"
         )
+
+    if cache_key:
+        # Cache a detached copy; admin handlers only read its attributes
+        admin_user_cache.set(
+            cache_key,
+            User(
+                id=current_user.id,
+                username=current_user.username,
+                email=current_user.email,
+                full_name=current_user.full_name,
+                is_active=current_user.is_active,
+                is_admin=current_user.is_admin,
+                is_verified=current_user.is_verified,
+            ),
+        )
     return current_user
 
 
@@ -49,49 +131,55 @@ async def get_all_users_with_stats(
     Get all users with their statistics (board count, task count).
     Only accessible by admin users.
     """
-    # Query users with their boards and tasks for statistics
     result = await db.execute(
-        select(User)
-        .options(
-            selectinload(User.boards)
-            .selectinload(Board.columns)
-            .selectinload(Column.tasks)
-        )
-        .order_by(User.id)
+        select(
+            User.id,
+            User.username,
+            User.email,
+            User.full_name,
+            User.is_active,
+            User.is_admin,
+            User.is_verified,
+            User.created_at,
+        ).order_by(User.id)
     )
-    users = result.scalars().all()
-
-    user_stats = []
-    for user in users:
-        # Count boards owned by user
-        board_count = len(user.boards)
-
-        # Count tasks across all user's boards
-        task_count = 0
-        for board in user.boards:
-            for column in board.columns:
-                task_count += len(column.tasks)
-
-        user_stats.append(
-            UserStatsResponse(
-                id=user.id,
-                username=user.username,
-                email=user.email,
-                full_name=user.full_name,
-                is_active=user.is_active,
-                is_admin=user.is_admin,
-                is_verified=user.is_verified,
-                created_at=user.created_at,
-                board_count=board_count,
-                task_count=task_count,
-            )
+    users = result.all()
+
+    # Count boards and tasks per owner in SQL rather than hydrating every
+    # board, column and task just to take len() of them
+    board_counts_result = await db.execute(
+        select(Board.owner_id, func.count(Board.id)).group_by(Board.owner_id)
+    )
+    board_counts = dict(board_counts_result.all())
+
+    task_counts_result = await db.execute(
+        select(Board.owner_id, func.count(Task.id))
+        .select_from(Board)
+        .join(Column, Column.board_id == Board.id)
+        .join(Task, Task.column_id == Column.id)
+        .group_by(Board.owner_id)
+    )
+    task_counts = dict(task_counts_result.all())
+
+    user_stats = [
+        UserStatsResponse(
+            **user._mapping,
+            board_count=board_counts.get(user.id, 0),
+            task_count=task_counts.get(user.id, 0),
         )
+        for user in users
+    ]
 
     return user_stats
 
 
-@router.get("/stats", response_model=Dict[str, Any])
+@router.get(
+    "/stats",
+    response_model=Dict[str, Any],
+    dependencies=[Depends(admin_stats_rate_limiter)],
+)
 async def get_admin_stats(
+    request: Request,
     db: AsyncSession = Depends(get_db_session),
     admin_user: User = Depends(get_admin_user),
 ):
@@ -99,28 +187,35 @@ async def get_admin_stats(
     Get overall system statistics.
     Only accessible by admin users.
     """
-    # Get total counts
-    total_users_result = await db.execute(select(func.count(User.id)))
-    total_users = total_users_result.scalar()
-
-    active_users_result = await db.execute(
-        select(func.count(User.id)).where(User.is_active == True)
-    )
-    active_users = active_users_result.scalar()
+    redis_client = getattr(request.app.state, "redis_client", None)
 
-    total_boards_result = await db.execute(select(func.count(Board.id)))
-    total_boards = total_boards_result.scalar()
+    stats = await _get_cached_stats(redis_client, ADMIN_STATS_CACHE_KEY)
+    if stats is not None:
+        return stats
 
-    # Get total tasks count
-    total_tasks_result = await db.execute(select(func.count(Task.id)))
-    total_tasks = total_tasks_result.scalar()
+    # Get all totals in a single round-trip
+    try:
+        result = await db.execute(
+            select(
+                select(func.count(User.id)).scalar_subquery().label("total_users"),
+                select(func.count(User.id))
+                .where(User.is_active == True)
+                .scalar_subquery()
+                .label("active_users"),
+                select(func.count(Board.id)).scalar_subquery().label("total_boards"),
+                select(func.count(Task.id)).scalar_subquery().label("total_tasks"),
+            )
+        )
+        stats = dict(result.one()._mapping)
+    except Exception:
+        stats = await _get_cached_stats(redis_client, ADMIN_STATS_STALE_KEY)
+        if stats is None:
+            raise
+        logger.warning("Admin stats query failed, serving stale cached stats")
+        return stats
 
-    return {
-        "total_users": total_users,
-        "active_users": active_users,
-        "total_boards": total_boards,
-        "total_tasks": total_tasks,
-    }
+    await _set_cached_stats(redis_client, stats)
+    return stats
 
 
 @router.patch("/users/{user_id}", response_model=UserStatsResponse)
@@ -136,13 +231,7 @@ async def update_user(
     """
     # Get the user to update
     result = await db.execute(
-        select(User)
-        .options(
-            selectinload(User.boards)
-            .selectinload(Board.columns)
-            .selectinload(Column.tasks)
-        )
-        .where(User.id == user_id)
+        select(User).options(raiseload("*")).where(User.id == user_id)
     )
     user = result.scalar_one_or_none()
 
@@ -158,17 +247,36 @@ async def update_user(
             detail="Cannot disable your own account",
         )
 
-    # Prevent admin from removing their own admin status if they're the only admin
+    # Prevent admin from removing their own admin status if they're the only
+    # admin. The UPDATE rows differ between two admins demoting themselves,
+    # so under READ COMMITTED both EXISTS checks could pass. Locking every
+    # active admin row first, in id order, makes the second demotion wait for
+    # the first to commit and then see one admin fewer.
     if user_id == admin_user.id and update_data.is_admin is False and user.is_admin:
-        # Check if there are other admins
-        other_admins_result = await db.execute(
-            select(func.count(User.id)).where(
-                User.is_admin == True, User.id != user_id, User.is_active == True
+        await db.execute(
+            select(User.id)
+            .where(User.is_admin == True, User.is_active == True)
+            .order_by(User.id)
+            .with_for_update()
+        )
+
+        other_admin = aliased(User)
+        demote_result = await db.execute(
+            update(User)
+            .where(
+                User.id == user_id,
+                exists().where(
+                    other_admin.is_admin == True,
+                    other_admin.is_active == True,
+                    other_admin.id != user_id,
+                ),
             )
+            .values(is_admin=False)
+            .returning(User.id)
+            .execution_options(synchronize_session="fetch")
         )
-        other_admins_count = other_admins_result.scalar()
 
-        if other_admins_count == 0:
+        if demote_result.first() is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cannot remove admin status - you are the only active admin",
@@ -181,17 +289,24 @@ async def update_user(
     if update_data.is_admin is not None:
         user.is_admin = update_data.is_admin
 
-    await db.commit()
-    await db.refresh(user)
+    await db.flush()
 
     # Calculate statistics for response
-    board_count = len(user.boards)
-    task_count = 0
-    for board in user.boards:
-        for column in board.columns:
-            task_count += len(column.tasks)
+    board_count_result = await db.execute(
+        select(func.count(Board.id)).where(Board.owner_id == user_id)
+    )
+    board_count = board_count_result.scalar()
+
+    task_count_result = await db.execute(
+        select(func.count(Task.id))
+        .select_from(Board)
+        .join(Column, Column.board_id == Board.id)
+        .join(Task, Task.column_id == Column.id)
+        .where(Board.owner_id == user_id)
+    )
+    task_count = task_count_result.scalar()
 
-    return UserStatsResponse(
+    response = UserStatsResponse(
         id=user.id,
         username=user.username,
         email=user.email,
@@ -203,3 +318,12 @@ async def update_user(
         board_count=board_count,
         task_count=task_count,
     )
+    await db.commit()
+
+    # Privileges may have changed, so drop all cached admin checks. Only after
+    # the commit: a request that misses the cache before then would re-read
+    # and re-cache the old row for the full TTL
+    admin_user_cache.clear()
+    invalidate_cached_user(user_id)
+
+    return response
@@ -5,15 +5,19 @@ This module provides REST API endpoints for managing API keys,
 including creation, listing, updating, and deletion of API keys.
 """
 
+import logging
+from operator import attrgetter
 from typing import List
 from datetime import datetime, timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, and_, or_, case, func, bindparam
+from sqlalchemy.orm import raiseload
 
 from ..database import get_db_session
-from ..models import ApiKey, User, ApiKeyScope as ModelApiKeyScope
+from ..models import ApiKey, ApiKeyScope as ModelApiKeyScope
+from ..models.api_key import parse_scopes
 from ..schemas import (
     ApiKeyCreate,
     ApiKeyUpdate,
@@ -22,14 +26,50 @@ from ..schemas import (
     ApiKeyListResponse,
     ApiKeyUsageStats,
 )
-from ..auth.dependencies import get_current_user, get_user_from_api_key_or_jwt
+from ..auth.dependencies import get_current_user_id
 
-router = APIRouter(prefix="/api-keys", tags=["api-keys"])
+router = APIRouter(
+    prefix="/api-keys", tags=["api-keys"], default_response_class=ORJSONResponse
+)
+logger = logging.getLogger(__name__)
+
+# Statements used on every request are built once at import; handlers only
+# bind parameters, and the compiled form is reused from the statement cache.
+
+# Read-only listing, so fetch plain rows rather than ORM instances
+_LIST_API_KEYS_STMT = (
+    select(
+        ApiKey.id,
+        ApiKey.name,
+        ApiKey.description,
+        ApiKey.key_prefix,
+        ApiKey.scopes,
+        ApiKey.expires_at,
+        ApiKey.is_active,
+        ApiKey.last_used_at,
+        ApiKey.usage_count,
+        ApiKey.created_at,
+        ApiKey.updated_at,
+    )
+    .where(ApiKey.user_id == bindparam("user_id"))
+    .order_by(ApiKey.created_at.desc())
+)
+
+_API_KEY_BY_ID_STMT = (
+    select(ApiKey)
+    .options(raiseload("*"))
+    .where(
+        and_(
+            ApiKey.id == bindparam("key_id"),
+            ApiKey.user_id == bindparam("user_id"),
+        )
+    )
+)
 
 
 @router.get("/", response_model=ApiKeyListResponse)
 async def list_api_keys(
-    current_user: User = Depends(get_user_from_api_key_or_jwt),
+    current_user_id: int = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db_session),
 ):
     """
@@ -37,40 +77,25 @@ async def list_api_keys(
 
     Returns all API keys owned by the authenticated user, excluding the actual key values.
     """
-    result = await db.execute(
-        select(ApiKey)
-        .where(ApiKey.user_id == current_user.id)
-        .order_by(ApiKey.created_at.desc())
-    )
+    result = await db.execute(_LIST_API_KEYS_STMT, {"user_id": current_user_id})
 
-    api_keys = result.scalars().all()
+    rows = result.all()
 
-    # Debug logging
-    print(
-        f"[API_KEYS] User {current_user.id} ({current_user.username}) requesting API keys"
-    )
-    print(f"[API_KEYS] Found {len(api_keys)} API keys in database")
-    for key in api_keys:
-        print(f"[API_KEYS] - Key ID {key.id}: {key.name} (active: {key.is_active})")
-
-    # Convert to response format
-    api_key_responses = []
-    for key in api_keys:
-        api_key_responses.append(
-            ApiKeyResponse(
-                id=key.id,
-                name=key.name,
-                description=key.description,
-                key_prefix=key.key_prefix,
-                scopes=key.get_scopes_list(),
-                expires_at=key.expires_at,
-                is_active=key.is_active,
-                last_used_at=key.last_used_at,
-                usage_count=key.usage_count,
-                created_at=key.created_at,
-                updated_at=key.updated_at,
-            )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "User %s listed %d API keys: %s",
+            current_user_id,
+            len(rows),
+            [(row.id, row.is_active) for row in rows],
+        )
+
+    # Rows come straight from the database, so skip per-field validation
+    api_key_responses = [
+        ApiKeyResponse.model_construct(
+            **{**row._mapping, "scopes": list(parse_scopes(row.scopes))}
         )
+        for row in rows
+    ]
 
     return ApiKeyListResponse(api_keys=api_key_responses, total=len(api_key_responses))
 
@@ -80,7 +105,7 @@ async def list_api_keys(
 )
 async def create_api_key(
     key_data: ApiKeyCreate,
-    current_user: User = Depends(get_user_from_api_key_or_jwt),
+    current_user_id: int = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db_session),
 ):
     """
@@ -103,7 +128,7 @@ async def create_api_key(
         )
 
     # Convert scopes to string
-    scopes_str = ",".join([scope.value for scope in key_data.scopes])
+    scopes_str = ",".join(map(attrgetter("value"), key_data.scopes))
 
     # Create the API key record
     new_api_key = ApiKey(
@@ -111,18 +136,19 @@ async def create_api_key(
         description=key_data.description,
         key_hash=key_hash,
         key_prefix=key_prefix,
-        user_id=current_user.id,
+        user_id=current_user_id,
         scopes=scopes_str,
         expires_at=expires_at,
         is_active=True,
     )
 
     db.add(new_api_key)
-    await db.commit()
-    await db.refresh(new_api_key)
+    # Flushing returns the generated id and timestamps (eager_defaults), so
+    # the response is built before commit expires the instance
+    await db.flush()
 
     # Prepare response
-    key_info = ApiKeyResponse(
+    key_info = ApiKeyResponse.model_construct(
         id=new_api_key.id,
         name=new_api_key.name,
         description=new_api_key.description,
@@ -135,6 +161,7 @@ async def create_api_key(
         created_at=new_api_key.created_at,
         updated_at=new_api_key.updated_at,
     )
+    await db.commit()
 
     return ApiKeyCreateResponse(api_key=full_key, key_info=key_info)
 
@@ -142,7 +169,7 @@ async def create_api_key(
 @router.get("/{key_id}", response_model=ApiKeyResponse)
 async def get_api_key(
     key_id: int,
-    current_user: User = Depends(get_user_from_api_key_or_jwt),
+    current_user_id: int = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db_session),
 ):
     """
@@ -151,9 +178,7 @@ async def get_api_key(
     Returns API key information (excluding the actual key value).
     """
     result = await db.execute(
-        select(ApiKey).where(
-            and_(ApiKey.id == key_id, ApiKey.user_id == current_user.id)
-        )
+        _API_KEY_BY_ID_STMT, {"key_id": key_id, "user_id": current_user_id}
     )
 
     api_key = result.scalar_one_or_none()
@@ -162,7 +187,7 @@ async def get_api_key(
             status_code=status.HTTP_404_NOT_FOUND, detail="API key not found"
         )
 
-    return ApiKeyResponse(
+    return ApiKeyResponse.model_construct(
         id=api_key.id,
         name=api_key.name,
         description=api_key.description,
@@ -181,7 +206,7 @@ async def get_api_key(
 async def update_api_key(
     key_id: int,
     key_data: ApiKeyUpdate,
-    current_user: User = Depends(get_user_from_api_key_or_jwt),
+    current_user_id: int = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db_session),
 ):
     """
@@ -191,9 +216,7 @@ async def update_api_key(
     The actual key value and scopes cannot be changed.
     """
     result = await db.execute(
-        select(ApiKey).where(
-            and_(ApiKey.id == key_id, ApiKey.user_id == current_user.id)
-        )
+        _API_KEY_BY_ID_STMT, {"key_id": key_id, "user_id": current_user_id}
     )
 
     api_key = result.scalar_one_or_none()
@@ -210,10 +233,9 @@ async def update_api_key(
     if key_data.is_active is not None:
         api_key.is_active = key_data.is_active
 
-    await db.commit()
-    await db.refresh(api_key)
+    await db.flush()
 
-    return ApiKeyResponse(
+    response = ApiKeyResponse.model_construct(
         id=api_key.id,
         name=api_key.name,
         description=api_key.description,
@@ -226,12 +248,15 @@ async def update_api_key(
         created_at=api_key.created_at,
         updated_at=api_key.updated_at,
     )
+    await db.commit()
+
+    return response
 
 
 @router.delete("/{key_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_api_key(
     key_id: int,
-    current_user: User = Depends(get_user_from_api_key_or_jwt),
+    current_user_id: int = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db_session),
 ):
     """
@@ -240,9 +265,7 @@ async def delete_api_key(
     Permanently removes the API key. This action cannot be undone.
     """
     result = await db.execute(
-        select(ApiKey).where(
-            and_(ApiKey.id == key_id, ApiKey.user_id == current_user.id)
-        )
+        _API_KEY_BY_ID_STMT, {"key_id": key_id, "user_id": current_user_id}
     )
 
     api_key = result.scalar_one_or_none()
@@ -257,7 +280,7 @@ async def delete_api_key(
 
 @router.get("/stats/usage", response_model=ApiKeyUsageStats)
 async def get_api_key_stats(
-    current_user: User = Depends(get_user_from_api_key_or_jwt),
+    current_user_id: int = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db_session),
 ):
     """
@@ -265,27 +288,61 @@ async def get_api_key_stats(
 
     Returns statistics about the user's API keys including counts and usage patterns.
     """
+    from datetime import timezone
+
+    now = datetime.now(timezone.utc)
+    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    # Aggregate counts in SQL rather than loading every key
+    totals_result = await db.execute(
+        select(
+            func.count(ApiKey.id).label("total_keys"),
+            func.coalesce(
+                func.sum(
+                    case(
+                        (
+                            and_(
+                                ApiKey.is_active == True,
+                                or_(
+                                    ApiKey.expires_at.is_(None),
+                                    ApiKey.expires_at >= now,
+                                ),
+                            ),
+                            1,
+                        ),
+                        else_=0,
+                    )
+                ),
+                0,
+            ).label("active_keys"),
+            func.coalesce(
+                func.sum(case((ApiKey.expires_at < now, 1), else_=0)), 0
+            ).label("expired_keys"),
+            func.coalesce(func.sum(ApiKey.usage_count), 0).label("total_requests"),
+            # This is a simplified calculation - in a real system you'd track
+            # individual requests. For now, keys used today count as 1 request.
+            func.coalesce(
+                func.sum(case((ApiKey.last_used_at >= today_start, 1), else_=0)), 0
+            ).label("requests_today"),
+        ).where(ApiKey.user_id == current_user_id)
+    )
+    totals = totals_result.one()
+
+    # Only the top 5 most used keys are needed for the usage breakdown
     result = await db.execute(
         select(ApiKey)
-        .where(ApiKey.user_id == current_user.id)
+        .options(raiseload("*"))
+        .where(ApiKey.user_id == current_user_id)
         .order_by(ApiKey.usage_count.desc())
+        .limit(5)
     )
-
-    api_keys = result.scalars().all()
-
-    # Calculate statistics
-    total_keys = len(api_keys)
-    active_keys = sum(1 for key in api_keys if key.is_active and key.is_valid())
-    from datetime import timezone
-
-    now = datetime.now(timezone.utc)
-    expired_keys = sum(1 for key in api_keys if key.expires_at and key.expires_at < now)
+    top_keys = result.scalars().all()
 
     # Find most used key
     most_used_key = None
-    if api_keys and api_keys[0].usage_count > 0:
-        most_used = api_keys[0]
-        most_used_key = ApiKeyResponse(
+    if top_keys and top_keys[0].usage_count > 0:
+        most_used = top_keys[0]
+        most_used_key = ApiKeyResponse.model_construct(
             id=most_used.id,
             name=most_used.name,
             description=most_used.description,
@@ -300,36 +357,22 @@ async def get_api_key_stats(
         )
 
     # Recent usage (simplified for now)
-    recent_usage = []
-    for key in api_keys[:5]:  # Top 5 most used
-        if key.last_used_at:
-            recent_usage.append(
-                {
-                    "key_name": key.name,
-                    "last_used": key.last_used_at,
-                    "usage_count": key.usage_count,
-                }
-            )
-
-    # Calculate requests today based on last_used_at timestamps
-    from datetime import timezone, timedelta
-
-    now = datetime.now(timezone.utc)
-    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-
-    requests_today = 0
-    for key in api_keys:
-        if key.last_used_at and key.last_used_at >= today_start:
-            # This is a simplified calculation - in a real system you'd track individual requests
-            # For now, we'll count keys that were used today as having at least 1 request
-            requests_today += 1
+    recent_usage = [
+        {
+            "key_name": key.name,
+            "last_used": key.last_used_at,
+            "usage_count": key.usage_count,
+        }
+        for key in top_keys
+        if key.last_used_at
+    ]
 
     return ApiKeyUsageStats(
-        total_keys=total_keys,
-        active_keys=active_keys,
-        expired_keys=expired_keys,
+        total_keys=totals.total_keys,
+        active_keys=totals.active_keys,
+        expired_keys=totals.expired_keys,
         most_used_key=most_used_key,
         recent_usage=recent_usage,
-        total_requests=sum(key.usage_count for key in api_keys),
-        requests_today=requests_today,
+        total_requests=totals.total_requests,
+        requests_today=totals.requests_today,
     )
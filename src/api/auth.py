@@ -2,10 +2,13 @@
 Authentication API endpoints for user registration, login, and profile management.
 """
 
-from typing import Any
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from typing import Any, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, or_, bindparam
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import raiseload
 
 from ..database import get_db_session
 from ..models import User
@@ -19,17 +22,39 @@ from ..schemas import (
     TokenResponse,
     MessageResponse,
 )
-from ..auth.dependencies import get_current_user, get_current_admin_user, get_user_from_api_key_or_jwt
+from ..auth.dependencies import (
+    admin_user_cache,
+    get_current_user,
+    get_current_admin_user,
+    get_current_user_id,
+    invalidate_cached_token,
+    invalidate_cached_user,
+)
 from ..auth import session_service
+from ..auth.password_cache import (
+    hash_password,
+    rehash_if_needed,
+    verify_password_cached,
+)
+from ..middleware import login_rate_limiter, search_rate_limiter
 from ..utils.error_handler import (
     handle_auth_error,
     handle_validation_error,
     handle_not_found_error,
 )
 
-router = APIRouter(prefix="/auth", tags=["authentication"])
+router = APIRouter(
+    prefix="/auth", tags=["authentication"], default_response_class=ORJSONResponse
+)
 jwt_handler = JWTHandler()
 
+# Built once at import; login only binds the parameter per request
+_USER_BY_LOGIN_STMT = (
+    select(User)
+    .options(raiseload("*"))
+    .where((User.username == bindparam("login")) | (User.email == bindparam("login")))
+)
+
 
 @router.post(
     "/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED
@@ -43,19 +68,24 @@ async def register_user(
     Creates a new user with hashed password and returns user data.
     """
     try:
-        # Check if username already exists
+        # Check username and email uniqueness in a single round-trip
         result = await db.execute(
-            select(User).where(User.username == user_data.username)
+            select(User.username, User.email)
+            .where(
+                or_(
+                    User.username == user_data.username,
+                    User.email == user_data.email,
+                )
+            )
+            .limit(2)
         )
-        if result.scalar_one_or_none():
+        conflicts = result.all()
+        if any(row.username == user_data.username for row in conflicts):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Username already exists",
             )
-
-        # Check if email already exists
-        result = await db.execute(select(User).where(User.email == user_data.email))
-        if result.scalar_one_or_none():
+        if conflicts:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, detail="Email already exists"
             )
@@ -67,16 +97,25 @@ async def register_user(
             full_name=user_data.full_name,
             is_verified=True,  # Auto-verify for now, can add email verification later
         )
-        user.set_password(user_data.password)
+        user.hashed_password = await hash_password(user_data.password)
 
         db.add(user)
+        await db.flush()
+        response = UserResponse.model_validate(user)
         await db.commit()
-        await db.refresh(user)
 
-        return user
+        return response
 
     except HTTPException:
         raise
+    except IntegrityError as e:
+        # A concurrent registration took the username or email between the
+        # check above and the INSERT; the unique indexes reject it
+        await db.rollback()
+        field = "Username" if "username" in str(e.orig).lower() else "Email"
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=f"{field} already exists"
+        )
     except Exception as e:
         await db.rollback()
         handle_auth_error(
@@ -84,7 +123,7 @@ async def register_user(
         )
 
 
-@router.post("/login")
+@router.post("/login", dependencies=[Depends(login_rate_limiter)])
 async def login_user(
     request: Request,
     user_credentials: UserLogin,
@@ -99,14 +138,13 @@ async def login_user(
     try:
         # Try to find user by username or email
         result = await db.execute(
-            select(User).where(
-                (User.username == user_credentials.username)
-                | (User.email == user_credentials.username)
-            )
+            _USER_BY_LOGIN_STMT, {"login": user_credentials.username}
         )
         user = result.scalar_one_or_none()
 
-        if not user or not user.verify_password(user_credentials.password):
+        if not user or not await verify_password_cached(
+            user.hashed_password, user_credentials.password
+        ):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid credentials",
@@ -118,6 +156,13 @@ async def login_user(
                 status_code=status.HTTP_401_UNAUTHORIZED, detail="Account not active"
             )
 
+        # Upgrade legacy bcrypt hashes to Argon2id; saved with the session below
+        new_hash = await rehash_if_needed(
+            user.hashed_password, user_credentials.password
+        )
+        if new_hash:
+            user.hashed_password = new_hash
+
         # Create JWT token
         token_response = jwt_handler.create_token_response(user.id, user.username)
         
@@ -131,6 +176,7 @@ async def login_user(
             user_agent=user_agent,
             ip_address=ip_address,
         )
+        await db.commit()
         
         return token_response
 
@@ -161,6 +207,7 @@ async def logout_user(
     
     if token:
         await session_service.delete_session(db, token)
+        invalidate_cached_token(token)
     
     return {"message": "Logged out successfully"}
 
@@ -183,8 +230,10 @@ async def update_current_user_profile(
 
     # Check if email is being changed and if it's already taken
     if user_update.email and user_update.email != current_user.email:
-        result = await db.execute(select(User).where(User.email == user_update.email))
-        if result.scalar_one_or_none():
+        result = await db.execute(
+            select(User.id).where(User.email == user_update.email).limit(1)
+        )
+        if result.first() is not None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered",
@@ -195,10 +244,12 @@ async def update_current_user_profile(
     if user_update.full_name is not None:
         current_user.full_name = user_update.full_name
 
+    await db.flush()
+    response = UserResponse.model_validate(current_user)
     await db.commit()
-    await db.refresh(current_user)
+    invalidate_cached_user(current_user.id)
 
-    return current_user
+    return response
 
 
 @router.post("/change-password")
@@ -209,8 +260,8 @@ async def change_password(
 ):
     """Change user password."""
     # Verify current password
-    if not verify_password(
-        password_data.current_password, current_user.hashed_password
+    if not await verify_password_cached(
+        current_user.hashed_password, password_data.current_password
     ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -218,14 +269,15 @@ async def change_password(
         )
 
     # Update password
-    current_user.hashed_password = hash_password(password_data.new_password)
+    current_user.hashed_password = await hash_password(password_data.new_password)
     await db.commit()
+    invalidate_cached_user(current_user.id)
 
     return MessageResponse(message="Password changed successfully")
 
 
 @router.get("/debug")
-async def debug_auth(request: Request):
+async def debug_auth(request: Request, db: AsyncSession = Depends(get_db_session)):
     """Debug authentication status."""
     try:
         # Check for access token in cookies
@@ -234,21 +286,18 @@ async def debug_auth(request: Request):
             return {"status": "no_cookie", "cookies": list(request.cookies.keys())}
 
         # Try to decode token
-        from ..auth.jwt_handler import JWTHandler
-
-        jwt_handler = JWTHandler()
         token_data = jwt_handler.verify_token(access_token)
 
         if not token_data:
             return {"status": "invalid_token", "token_length": len(access_token)}
 
         # Check user in database
-        from ..database import get_db_session
-        from sqlalchemy import select
-
-        async with get_db_session() as db:
-            result = await db.execute(select(User).where(User.id == token_data.user_id))
-            user = result.scalar_one_or_none()
+        result = await db.execute(
+            select(User.id, User.username, User.email).where(
+                User.id == token_data.user_id
+            )
+        )
+        user = result.one_or_none()
 
         if not user:
             return {"status": "user_not_found", "token_user_id": token_data.user_id}
@@ -268,12 +317,39 @@ async def debug_auth(request: Request):
 
 @router.get("/users", response_model=list[UserResponse])
 async def list_users(
+    response: Response,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[int] = Query(None, description="Return users with a lower ID"),
     current_user: User = Depends(get_current_admin_user),
     db: AsyncSession = Depends(get_db_session),
 ) -> Any:
-    """List all users (admin only)."""
-    result = await db.execute(select(User).order_by(User.created_at.desc()))
-    users = result.scalars().all()
+    """
+    List users newest first (admin only).
+
+    Users are returned a page at a time (``limit``, 100 by default); when
+    more remain, the ``X-Next-Cursor`` response header holds the ``cursor``
+    for the next page.
+    """
+    query = select(
+        User.id,
+        User.username,
+        User.email,
+        User.full_name,
+        User.is_active,
+        User.is_admin,
+        User.is_verified,
+        User.created_at,
+        User.updated_at,
+    ).order_by(User.id.desc())
+    if cursor is not None:
+        query = query.where(User.id < cursor)
+
+    # Fetch one extra row to learn whether another page exists
+    result = await db.execute(query.limit(limit + 1))
+    users = [dict(row) for row in result.mappings()]
+    if len(users) > limit:
+        users = users[:limit]
+        response.headers["X-Next-Cursor"] = str(users[-1]["id"])
     return users
 
 
@@ -284,7 +360,9 @@ async def activate_user(
     db: AsyncSession = Depends(get_db_session),
 ) -> Any:
     """Activate a user account (admin only)."""
-    result = await db.execute(select(User).where(User.id == user_id))
+    result = await db.execute(
+        select(User).options(raiseload("*")).where(User.id == user_id)
+    )
     user = result.scalar_one_or_none()
 
     if not user:
@@ -293,10 +371,12 @@ async def activate_user(
         )
 
     user.is_active = True
+    await db.flush()
+    response = UserResponse.model_validate(user)
     await db.commit()
-    await db.refresh(user)
+    invalidate_cached_user(user.id)
 
-    return user
+    return response
 
 
 @router.put("/users/{user_id}/deactivate", response_model=UserResponse)
@@ -306,7 +386,9 @@ async def deactivate_user(
     db: AsyncSession = Depends(get_db_session),
 ) -> Any:
     """Deactivate a user account (admin only)."""
-    result = await db.execute(select(User).where(User.id == user_id))
+    result = await db.execute(
+        select(User).options(raiseload("*")).where(User.id == user_id)
+    )
     user = result.scalar_one_or_none()
 
     if not user:
@@ -321,17 +403,22 @@ async def deactivate_user(
         )
 
     user.is_active = False
+    await db.flush()
+    response = UserResponse.model_validate(user)
     await db.commit()
-    await db.refresh(user)
 
-    return user
+    # Invalidate once the change is visible to other requests
+    admin_user_cache.clear()
+    invalidate_cached_user(user.id)
+
+    return response
 
 
-@router.get("/users/search")
+@router.get("/users/search", dependencies=[Depends(search_rate_limiter)])
 async def search_users(
     email: str = None,
     username: str = None,
-    current_user: User = Depends(get_user_from_api_key_or_jwt),
+    current_user_id: int = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db_session),
 ):
     """
@@ -346,8 +433,10 @@ async def search_users(
             detail="Please provide either email or username to search"
         )
     
-    # Build query
-    query = select(User).where(User.is_active == True)
+    # Build query over just the returned columns
+    query = select(User.id, User.username, User.email, User.full_name).where(
+        User.is_active == True
+    )
     
     if email:
         query = query.where(User.email.ilike(f"%{email}%"))
@@ -358,15 +447,6 @@ async def search_users(
     query = query.limit(10)
     
     result = await db.execute(query)
-    users = result.scalars().all()
-    
+
     # Return basic user info only
-    return [
-        {
-            "id": user.id,
-            "username": user.username,
-            "email": user.email,
-            "full_name": user.full_name,
-        }
-        for user in users
-    ]
+    return [dict(row) for row in result.mappings()]
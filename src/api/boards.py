@@ -4,12 +4,13 @@ Board management API routes.
 Provides CRUD operations for kanban boards.
 """
 
-from typing import List, Optional
+from collections import defaultdict
+from typing import List, NamedTuple, Optional, Tuple
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_
-from sqlalchemy.orm import selectinload
+from sqlalchemy import exists, insert, select, or_, union_all
 
 from ..database import get_db_session
 from ..models.board import Board
@@ -20,58 +21,103 @@ from ..schemas import (
     BoardCreate,
     BoardResponse,
     BoardUpdate,
+    BoardColumnResponse,
     BoardWithColumnsResponse,
     ColumnWithTasksResponse,
 )
 from ..auth.dependencies import get_current_user, get_user_from_api_key_or_jwt
 from ..utils.sql import get_sql_builder
+from ..utils.ttl_cache import TTLCache
 
 
-async def _get_accessible_owner_ids(db: AsyncSession, user: User) -> List[int]:
-    """
-    Get all owner IDs that the user can access boards for.
+class BoardAccess(NamedTuple):
+    """Who the current user can access boards as."""
+
+    user_id: int
+    group_ids: Tuple[int, ...]
+
+
+# Board access per user ID. Group membership changes rarely, so it is cached
+# per worker; the group endpoints invalidate it when membership changes.
+board_access_cache = TTLCache(maxsize=10_000, ttl=60)
+
 
-    This includes:
-    - User's own ID (direct ownership)
-    - Group IDs where the user is a member
+def invalidate_board_access(user_id: int) -> None:
+    """Forget the cached board access of a user."""
+    board_access_cache.pop(user_id)
+
+
+async def _get_board_access(db: AsyncSession, user: User) -> BoardAccess:
     """
-    accessible_ids = [user.id]
+    Get the ownership the user can access boards through.
 
-    # Add group IDs where user is a member
+    Boards are accessible when owned by the user directly (owner_id) or by a
+    group the user is a member of (group_id). The two are kept apart because
+    user and group IDs come from different sequences and may collide.
+    """
     from ..models import UserGroup
 
+    access = board_access_cache.get(user.id)
+    if access is not None:
+        return access
+
     group_result = await db.execute(
         select(UserGroup.group_id).where(UserGroup.user_id == user.id)
     )
-    group_ids = [row[0] for row in group_result.fetchall()]
-    accessible_ids.extend(group_ids)
+    access = BoardAccess(user.id, tuple(group_result.scalars().all()))
+    board_access_cache.set(user.id, access)
+    return access
 
-    return accessible_ids
 
+async def get_board_access(
+    request: Request,
+    db: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_user_from_api_key_or_jwt),
+) -> BoardAccess:
+    """
+    Dependency returning the current user's board access.
 
-async def _can_access_board(db: AsyncSession, user: User, board_id: int) -> bool:
+    The membership lookup runs at most once per request; the result is kept
+    on request.state for any later caller in the same request, on top of the
+    per-worker cache.
     """
-    Check if user can access a specific board.
-    Returns True if user owns the board directly or through group membership.
+    access = getattr(request.state, "board_access", None)
+    if access is None:
+        access = await _get_board_access(db, current_user)
+        request.state.board_access = access
+    return access
+
+
+def _board_access_filter(access: BoardAccess):
     """
-    accessible_owner_ids = await _get_accessible_owner_ids(db, user)
+    WHERE clause matching boards the user can access, either by direct
+    ownership or through group membership.
 
-    result = await db.execute(
-        select(Board).where(
-            and_(
-                Board.id == board_id,
-                or_(
-                    Board.owner_id.in_(accessible_owner_ids),
-                    Board.group_id.in_(accessible_owner_ids),
-                ),
-            )
-        )
+    Meant for lookups by primary key, where the OR only filters one row.
+    """
+    return or_(
+        Board.owner_id == access.user_id,
+        Board.group_id.in_(access.group_ids),
     )
 
-    return result.scalar_one_or_none() is not None
 
+def _accessible_board_ids(access: BoardAccess):
+    """
+    Subquery of IDs of boards the user can access, for listings.
 
-router = APIRouter(prefix="/boards", tags=["boards"])
+    An OR across owner_id and group_id often makes the planner fall back to
+    a sequential scan; as UNION ALL each branch uses its own index.
+    """
+    by_owner = select(Board.id).where(Board.owner_id == access.user_id)
+    if not access.group_ids:
+        return by_owner
+    by_group = select(Board.id).where(Board.group_id.in_(access.group_ids))
+    return union_all(by_owner, by_group)
+
+
+router = APIRouter(
+    prefix="/boards", tags=["boards"], default_response_class=ORJSONResponse
+)
 
 
 @router.post("/", response_model=BoardResponse, status_code=status.HTTP_201_CREATED)
@@ -87,16 +133,16 @@ async def create_board(
         # Check if user is a member of the specified group
         from ..models import UserGroup
 
-        group_membership = await db.execute(
-            select(UserGroup).where(
-                and_(
+        is_member = await db.scalar(
+            select(
+                exists().where(
                     UserGroup.group_id == board.group_id,
                     UserGroup.user_id == current_user.id,
                 )
             )
         )
 
-        if not group_membership.scalar_one_or_none():
+        if not is_member:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="You are not a member of the specified group",
@@ -120,42 +166,52 @@ async def create_board(
     db.add(db_board)
     await db.flush()  # Get the board ID
 
-    # Create default columns
-    default_columns = [
-        {"name": "To Do", "position": 0},
-        {"name": "In Progress", "position": 1},
-        {"name": "Done", "position": 2},
-    ]
-
-    for col_data in default_columns:
-        db_column = Column(
-            name=col_data["name"], position=col_data["position"], board_id=db_board.id
-        )
-        db.add(db_column)
+    # Create default columns in a single batched INSERT
+    default_columns = ["To Do", "In Progress", "Done"]
+    await db.execute(
+        insert(Column),
+        [
+            {"name": name, "position": position, "board_id": db_board.id}
+            for position, name in enumerate(default_columns)
+        ],
+    )
 
+    # The board's timestamps came back from the INSERT (eager_defaults), so
+    # the response can be built before committing without a refresh
+    response = BoardResponse.model_validate(db_board)
     await db.commit()
-    await db.refresh(db_board)
-    return db_board
+    return response
 
 
 @router.get("/", response_model=List[BoardResponse])
 async def list_boards(
+    response: Response,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[int] = Query(None, description="Return boards with a lower ID"),
     db: AsyncSession = Depends(get_db_session),
-    current_user: User = Depends(get_user_from_api_key_or_jwt),
+    access: BoardAccess = Depends(get_board_access),
 ):
-    """List all kanban boards accessible to the current user."""
-    # Get accessible owner IDs (user + future groups)
-    accessible_owner_ids = await _get_accessible_owner_ids(db, current_user)
+    """
+    List kanban boards accessible to the current user, newest first.
 
-    result = await db.execute(
-        select(Board).where(
-            or_(
-                Board.owner_id.in_(accessible_owner_ids),
-                Board.group_id.in_(accessible_owner_ids),
-            )
-        )
+    Boards are returned a page at a time (``limit``, 100 by default); when
+    more remain, the ``X-Next-Cursor`` response header holds the ``cursor``
+    for the next page.
+    """
+    query = (
+        select(Board)
+        .where(Board.id.in_(_accessible_board_ids(access)))
+        .order_by(Board.id.desc())
     )
+    if cursor is not None:
+        query = query.where(Board.id < cursor)
+
+    # Fetch one extra row to learn whether another page exists
+    result = await db.execute(query.limit(limit + 1))
     boards = result.scalars().all()
+    if len(boards) > limit:
+        boards = boards[:limit]
+        response.headers["X-Next-Cursor"] = str(boards[-1].id)
     return boards
 
 
@@ -163,60 +219,68 @@ async def list_boards(
 async def get_board(
     board_id: int,
     db: AsyncSession = Depends(get_db_session),
-    current_user: User = Depends(get_user_from_api_key_or_jwt),
+    access: BoardAccess = Depends(get_board_access),
 ):
     """Get a specific board with its columns and tasks."""
-    # Check if user can access this board (direct ownership or group membership)
-    if not await _can_access_board(db, current_user, board_id):
+    # Fetch the board only if the user can access it (direct ownership or
+    # group membership), so the access check and the load are one query
+    result = await db.execute(
+        select(
+            Board.id,
+            Board.name,
+            Board.description,
+            Board.owner_id,
+            Board.group_id,
+            Board.created_at,
+            Board.updated_at,
+        ).where(Board.id == board_id, _board_access_filter(access))
+    )
+    board = result.first()
+    if board is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Board not found"
         )
 
-    # Get the board with columns and tasks in a single query
-
-    result = await db.execute(
-        select(Board)
-        .where(Board.id == board_id)
-        .options(selectinload(Board.columns).selectinload(Column.tasks))
+    # The board ID is known, so columns and tasks are read with plain indexed
+    # queries instead of relationship loads, and no ORM objects are built
+    columns_result = await db.execute(
+        select(Column.id, Column.name, Column.position)
+        .where(Column.board_id == board_id)
+        .order_by(Column.position)
+    )
+    tasks_result = await db.execute(
+        select(
+            Task.id,
+            Task.column_id,
+            Task.title,
+            Task.description,
+            Task.position,
+            Task.tags,
+            Task.priority,
+            Task.steps,
+            Task.results,
+            Task.task_metadata,
+            Task.created_at,
+            Task.updated_at,
+        )
+        .where(
+            Task.column_id.in_(select(Column.id).where(Column.board_id == board_id))
+        )
+        .order_by(Task.column_id, Task.position)
     )
-    board = result.scalar_one_or_none()
 
-    # Convert to dict with columns and tasks
-    board_dict = {
-        "id": board.id,
-        "name": board.name,
-        "description": board.description,
-        "owner_id": board.owner_id,
-        "group_id": board.group_id,
-        "created_at": board.created_at,
-        "updated_at": board.updated_at,
-        "columns": [
-            {
-                "id": col.id,
-                "name": col.name,
-                "position": col.position,
-                "tasks": [
-                    {
-                        "id": task.id,
-                        "title": task.title,
-                        "description": task.description,
-                        "position": task.position,
-                        "tags": task.tags,
-                        "priority": task.priority,
-                        "steps": task.steps,
-                        "results": task.results,
-                        "task_metadata": task.task_metadata,
-                        "created_at": task.created_at,
-                        "updated_at": task.updated_at,
-                    }
-                    for task in sorted(col.tasks, key=lambda t: t.position)
-                ],
-            }
-            for col in sorted(board.columns, key=lambda c: c.position)
-        ],
-    }
+    # Tasks arrive ordered by position within each column
+    tasks_by_column = defaultdict(list)
+    for task in tasks_result.mappings():
+        tasks_by_column[task["column_id"]].append(dict(task))
 
-    return board_dict
+    return BoardWithColumnsResponse(
+        **board._mapping,
+        columns=[
+            BoardColumnResponse(**column._mapping, tasks=tasks_by_column[column.id])
+            for column in columns_result
+        ],
+    )
 
 
 @router.put("/{board_id}", response_model=BoardResponse)
@@ -224,72 +288,79 @@ async def update_board(
     board_id: int,
     board_update: BoardUpdate,
     db: AsyncSession = Depends(get_db_session),
-    current_user: User = Depends(get_user_from_api_key_or_jwt),
+    access: BoardAccess = Depends(get_board_access),
 ):
     """Update a board's name or description."""
-    # Check if user can access this board (direct ownership or group membership)
-    if not await _can_access_board(db, current_user, board_id):
+    # Fetch the board only if the user can access it (direct ownership or
+    # group membership)
+    result = await db.execute(
+        select(Board).where(
+            Board.id == board_id, _board_access_filter(access)
+        )
+    )
+    board = result.scalar_one_or_none()
+    if board is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Board not found"
         )
 
-    result = await db.execute(select(Board).where(Board.id == board_id))
-    board = result.scalar_one_or_none()
-
     if board_update.name is not None:
         board.name = board_update.name
     if board_update.description is not None:
         board.description = board_update.description
 
+    await db.flush()
+    response = BoardResponse.model_validate(board)
     await db.commit()
-    await db.refresh(board)
-    return board
+    return response
 
 
 @router.get("/{board_id}/columns")
 async def get_board_columns(
     board_id: int,
     db: AsyncSession = Depends(get_db_session),
-    current_user: User = Depends(get_user_from_api_key_or_jwt),
+    access: BoardAccess = Depends(get_board_access),
 ):
     """Get all columns for a specific board."""
     # Check if user can access this board (direct ownership or group membership)
-    if not await _can_access_board(db, current_user, board_id):
+    can_access = await db.scalar(
+        select(exists().where(Board.id == board_id, _board_access_filter(access)))
+    )
+    if not can_access:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Board not found"
         )
 
+    # A board has a handful of columns, so they are not paginated; only the
+    # returned fields are selected
     columns_result = await db.execute(
-        select(Column).where(Column.board_id == board_id).order_by(Column.position)
+        select(Column.id, Column.name, Column.position, Column.board_id)
+        .where(Column.board_id == board_id)
+        .order_by(Column.position)
     )
-    columns = columns_result.scalars().all()
 
-    return [
-        {
-            "id": col.id,
-            "name": col.name,
-            "position": col.position,
-            "board_id": col.board_id,
-        }
-        for col in columns
-    ]
+    return [dict(row) for row in columns_result.mappings()]
 
 
 @router.delete("/{board_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_board(
     board_id: int,
     db: AsyncSession = Depends(get_db_session),
-    current_user: User = Depends(get_user_from_api_key_or_jwt),
+    access: BoardAccess = Depends(get_board_access),
 ):
     """Delete a board and all its columns and tasks."""
-    # Check if user can access this board (direct ownership or group membership)
-    if not await _can_access_board(db, current_user, board_id):
+    # Fetch the board only if the user can access it (direct ownership or
+    # group membership)
+    result = await db.execute(
+        select(Board).where(
+            Board.id == board_id, _board_access_filter(access)
+        )
+    )
+    board = result.scalar_one_or_none()
+    if board is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Board not found"
         )
 
-    result = await db.execute(select(Board).where(Board.id == board_id))
-    board = result.scalar_one_or_none()
-
     await db.delete(board)
     await db.commit()
@@ -4,29 +4,57 @@ Column management API routes.
 Provides CRUD operations for kanban board columns.
 """
 
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy import exists, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload, selectinload
 
-from ..database import get_db
+from ..database import get_db_session
 from ..models import Board, Column
 from ..schemas import (
     ColumnCreate,
     ColumnResponse,
     ColumnUpdate,
     ColumnWithTasksResponse,
+    ColumnWithTaskSummariesResponse,
 )
+from ..utils.responses import make_json_response
 
-router = APIRouter(prefix="/columns", tags=["columns"])
+router = APIRouter(
+    prefix="/columns", tags=["columns"], default_response_class=ORJSONResponse
+)
+
+# Validator and serializer for one column and its tasks, built once at import
+_COLUMN_ADAPTER = TypeAdapter(ColumnWithTaskSummariesResponse)
+
+
+def _iter_columns_json(columns: List[Column]) -> Iterator[bytes]:
+    """Yield a JSON array of columns one encoded column at a time."""
+    separator = b"["
+    for column in columns:
+        yield separator + _COLUMN_ADAPTER.dump_json(
+            _COLUMN_ADAPTER.validate_python(column, from_attributes=True)
+        )
+        separator = b","
+    yield b"]" if separator == b"," else b"[]"
+
+
+async def _board_exists(db: AsyncSession, board_id: int) -> bool:
+    """Return True if the board exists, via SELECT EXISTS on its primary key."""
+    return await db.scalar(select(exists().where(Board.id == board_id)))
 
 
 @router.post("/", response_model=ColumnResponse, status_code=status.HTTP_201_CREATED)
-async def create_column(column: ColumnCreate, db: Session = Depends(get_db)):
+async def create_column(
+    column: ColumnCreate, db: AsyncSession = Depends(get_db_session)
+):
     """Create a new column in a board."""
-    # Verify board exists
-    board = db.query(Board).filter(Board.id == column.board_id).first()
-    if not board:
+    # Verify board exists without loading the row
+    if not await _board_exists(db, column.board_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Board not found"
         )
@@ -35,72 +63,63 @@ async def create_column(column: ColumnCreate, db: Session = Depends(get_db)):
         name=column.name, position=column.position, board_id=column.board_id
     )
     db.add(db_column)
-    db.commit()
-    db.refresh(db_column)
-    return db_column
+    await db.flush()
+    response = ColumnResponse.model_validate(db_column)
+    await db.commit()
+    return response
 
 
-@router.get("/board/{board_id}", response_model=List[ColumnWithTasksResponse])
-async def list_board_columns(board_id: int, db: Session = Depends(get_db)):
+@router.get(
+    "/board/{board_id}", response_model=List[ColumnWithTaskSummariesResponse]
+)
+async def list_board_columns(
+    board_id: int, db: AsyncSession = Depends(get_db_session)
+):
     """List all columns for a specific board."""
-    # Verify board exists
-    board = db.query(Board).filter(Board.id == board_id).first()
-    if not board:
+    # Verify board exists without loading the row
+    if not await _board_exists(db, board_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Board not found"
         )
 
-    columns = (
-        db.query(Column)
-        .filter(Column.board_id == board_id)
+    # Load every column's tasks in one IN query; any other relationship access
+    # raises instead of lazy loading per row
+    result = await db.execute(
+        select(Column)
+        .where(Column.board_id == board_id)
+        .options(selectinload(Column.tasks), raiseload("*"))
         .order_by(Column.position)
-        .all()
     )
+    columns = result.scalars().all()
 
-    # Convert to response format with tasks
-    result = []
-    for col in columns:
-        col_dict = {
-            "id": col.id,
-            "name": col.name,
-            "position": col.position,
-            "board_id": col.board_id,
-            "created_at": col.created_at.isoformat(),
-            "updated_at": col.updated_at.isoformat(),
-            "tasks": [
-                {
-                    "id": task.id,
-                    "title": task.title,
-                    "description": task.description,
-                    "position": task.position,
-                    "created_at": task.created_at.isoformat(),
-                    "updated_at": task.updated_at.isoformat(),
-                }
-                for task in col.tasks
-            ],
-        }
-        result.append(col_dict)
-
-    return result
+    # Stream the array column by column so only one column's encoded JSON is
+    # held at a time; response_model only documents the shape
+    return StreamingResponse(
+        _iter_columns_json(columns), media_type="application/json"
+    )
 
 
 @router.get("/{column_id}", response_model=ColumnWithTasksResponse)
-async def get_column(column_id: int, db: Session = Depends(get_db)):
+async def get_column(column_id: int, db: AsyncSession = Depends(get_db_session)):
     """Get a specific column with its tasks."""
-    column = db.query(Column).filter(Column.id == column_id).first()
+    result = await db.execute(
+        select(Column)
+        .where(Column.id == column_id)
+        .options(selectinload(Column.tasks), raiseload("*"))
+    )
+    column = result.scalar_one_or_none()
     if not column:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Column not found"
         )
 
-    # Convert to response format
-    col_dict = {
+    payload = {
         "id": column.id,
         "name": column.name,
         "position": column.position,
         "board_id": column.board_id,
-        "created_at": column.created_at.isoformat(),
-        "updated_at": column.updated_at.isoformat(),
+        "created_at": column.created_at,
+        "updated_at": column.updated_at,
         "tasks": [
             {
                 "id": task.id,
@@ -112,15 +131,17 @@ async def get_column(column_id: int, db: Session = Depends(get_db)):
         ],
     }
 
-    return col_dict
+    return make_json_response(payload)
 
 
 @router.put("/{column_id}", response_model=ColumnResponse)
 async def update_column(
-    column_id: int, column_update: ColumnUpdate, db: Session = Depends(get_db)
+    column_id: int,
+    column_update: ColumnUpdate,
+    db: AsyncSession = Depends(get_db_session),
 ):
     """Update a column's name or position."""
-    column = db.query(Column).filter(Column.id == column_id).first()
+    column = await db.get(Column, column_id)
     if not column:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Column not found"
@@ -131,30 +152,33 @@ async def update_column(
     if column_update.position is not None:
         column.position = column_update.position
 
-    db.commit()
-    db.refresh(column)
-    return column
+    await db.flush()
+    response = ColumnResponse.model_validate(column)
+    await db.commit()
+    return response
 
 
 @router.delete("/{column_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_column(column_id: int, db: Session = Depends(get_db)):
+async def delete_column(
+    column_id: int, db: AsyncSession = Depends(get_db_session)
+):
     """Delete a column and all its tasks."""
-    column = db.query(Column).filter(Column.id == column_id).first()
+    column = await db.get(Column, column_id)
     if not column:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Column not found"
         )
 
-    db.delete(column)
-    db.commit()
+    await db.delete(column)
+    await db.commit()
 
 
 @router.post("/{column_id}/reorder", status_code=status.HTTP_200_OK)
 async def reorder_column(
-    column_id: int, new_position: int, db: Session = Depends(get_db)
+    column_id: int, new_position: int, db: AsyncSession = Depends(get_db_session)
 ):
     """Reorder a column within its board."""
-    column = db.query(Column).filter(Column.id == column_id).first()
+    column = await db.get(Column, column_id)
     if not column:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Column not found"
@@ -163,28 +187,30 @@ async def reorder_column(
     old_position = column.position
     board_id = column.board_id
 
-    # Get all columns in the board
-    columns = (
-        db.query(Column)
-        .filter(Column.board_id == board_id)
-        .order_by(Column.position)
-        .all()
+    # Shift the columns between the old and new positions with one UPDATE;
+    # the moved column itself is excluded by the range
+    shift_columns = (
+        update(Column)
+        .where(Column.board_id == board_id)
+        .execution_options(synchronize_session=False)
     )
-
-    # Update positions
     if new_position > old_position:
         # Moving right - shift columns left
-        for col in columns:
-            if old_position < col.position <= new_position:
-                col.position -= 1
-    else:
+        await db.execute(
+            shift_columns.where(
+                Column.position > old_position, Column.position <= new_position
+            ).values(position=Column.position - 1)
+        )
+    elif new_position < old_position:
         # Moving left - shift columns right
-        for col in columns:
-            if new_position <= col.position < old_position:
-                col.position += 1
+        await db.execute(
+            shift_columns.where(
+                Column.position >= new_position, Column.position < old_position
+            ).values(position=Column.position + 1)
+        )
 
     # Set new position
     column.position = new_position
 
-    db.commit()
+    await db.commit()
     return {"message": "Column reordered successfully"}
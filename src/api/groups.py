@@ -3,15 +3,23 @@ Group management API endpoints.
 
 This module provides REST API endpoints for managing groups and group memberships,
 including creating groups, adding/removing members, and managing roles.
+
+Writes issued on raw asyncpg connections are single statements, with checks
+folded into CTEs or WHERE EXISTS guards, and rely on autocommit. A write that
+needs several statements must wrap all of them in one conn.transaction().
 """
 
+from datetime import datetime, timezone
 from typing import List
+import asyncpg
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_
-from sqlalchemy.orm import selectinload
+from sqlalchemy import delete, exists, func, literal, select, true, and_, or_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import aliased
 
-from ..database import get_db_session
+from ..database import get_db_session, get_pg_conn
 from ..models import Group, UserGroup, User, GroupRole as ModelGroupRole
 from ..schemas import (
     GroupCreate,
@@ -20,12 +28,22 @@ from ..schemas import (
     GroupListResponse,
     GroupMembershipRequest,
     GroupMembershipResponse,
+    GroupBulkMembershipRequest,
+    GroupBulkMembershipResponse,
     UserGroupResponse,
     GroupRole,
 )
 from ..auth.dependencies import get_current_user, get_user_from_api_key_or_jwt
+from ..utils.responses import make_json_response
+from .boards import invalidate_board_access
+
+router = APIRouter(
+    prefix="/groups", tags=["groups"], default_response_class=ORJSONResponse
+)
 
-router = APIRouter(prefix="/groups", tags=["groups"])
+# Role enums mapped between the model and the API schema once, at import
+_ROLE_MAP = {role: GroupRole(role.value) for role in ModelGroupRole}
+_MODEL_ROLE_MAP = {role: ModelGroupRole(role.value) for role in GroupRole}
 
 
 @router.get("/", response_model=List[GroupListResponse])
@@ -38,134 +56,94 @@ async def list_groups(
 
     Returns groups where the user is a member, along with their role in each group.
     """
-    # Get groups where user is a member
+    # Groups where the user is a member, with their role and each group's
+    # member count aggregated in SQL rather than loading every membership
+    members = aliased(UserGroup)
     result = await db.execute(
-        select(Group, UserGroup.role)
+        select(
+            Group.id,
+            Group.name,
+            Group.description,
+            Group.created_by,
+            Group.created_at,
+            Group.updated_at,
+            UserGroup.role,
+            func.count(members.id).label("member_count"),
+        )
         .join(UserGroup, Group.id == UserGroup.group_id)
+        .outerjoin(members, members.group_id == Group.id)
         .where(UserGroup.user_id == current_user.id)
-        .options(selectinload(Group.members))
+        .group_by(Group.id, UserGroup.role)
     )
 
-    groups_with_roles = result.all()
-
-    response = []
-    for group, user_role in groups_with_roles:
-        response.append(
-            GroupListResponse(
-                id=group.id,
-                name=group.name,
-                description=group.description,
-                created_by=group.created_by,
-                created_at=group.created_at,
-                updated_at=group.updated_at,
-                member_count=len(group.members),
-                user_role=GroupRole(user_role.value),
-            )
-        )
-
-    return response
+    # Plain dicts in the GroupListResponse shape, serialized by orjson without
+    # a second validation pass
+    payload = [
+        {
+            "id": row.id,
+            "name": row.name,
+            "description": row.description,
+            "created_by": row.created_by,
+            "created_at": row.created_at,
+            "updated_at": row.updated_at,
+            "member_count": row.member_count,
+            "user_role": row.role.value,
+        }
+        for row in result
+    ]
+
+    return make_json_response(payload)
 
 
 @router.post("/", response_model=GroupResponse, status_code=status.HTTP_201_CREATED)
 async def create_group(
     group_data: GroupCreate,
     current_user: User = Depends(get_user_from_api_key_or_jwt),
-    db: AsyncSession = Depends(get_db_session),
+    conn: asyncpg.Connection = Depends(get_pg_conn),
 ):
     """
     Create a new group using raw asyncpg to avoid MissingGreenlet errors.
 
     The current user becomes the owner of the newly created group.
     """
-    import os
-    import asyncpg
-    from datetime import datetime, timezone
-
-    # Get database connection info from environment
-    database_url = os.getenv("DATABASE_URL")
-    if not database_url:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Database configuration error",
-        )
-
     try:
-        # Parse database URL for asyncpg connection
-        import urllib.parse
-
-        parsed = urllib.parse.urlparse(database_url)
-
-        # Connect directly with asyncpg
-        conn = await asyncpg.connect(
-            host=parsed.hostname,
-            port=parsed.port or 5432,
-            user=parsed.username,
-            password=parsed.password,
-            database=parsed.path[1:],  # Remove leading slash
+        # Insert the group and the creator's owner membership in one
+        # statement: a single round trip, atomic without an explicit
+        # transaction. SQLAlchemy's Enum column stores member names in the
+        # grouprole type, so the role is passed as the enum name.
+        now = datetime.now(timezone.utc)
+        group_row = await conn.fetchrow(
+            """
+            WITH new_group AS (
+                INSERT INTO groups (name, description, created_by, created_at, updated_at)
+                VALUES ($1, $2, $3, $4, $4)
+                RETURNING id, name, description, created_by, created_at, updated_at
+            ), owner_membership AS (
+                INSERT INTO user_groups (user_id, group_id, role, created_at, updated_at)
+                SELECT $3, new_group.id, $5::grouprole, $4, $4
+                FROM new_group
+            )
+            SELECT id, name, description, created_by, created_at, updated_at
+            FROM new_group
+        """,
+            group_data.name,
+            group_data.description,
+            current_user.id,
+            now,
+            ModelGroupRole.OWNER.name,
         )
 
-        try:
-            # Start transaction
-            async with conn.transaction():
-                # Create the group
-                now = datetime.now(timezone.utc)
-                group_row = await conn.fetchrow(
-                    """
-                    INSERT INTO groups (name, description, created_by, created_at, updated_at)
-                    VALUES ($1, $2, $3, $4, $4)
-                    RETURNING id, name, description, created_by, created_at, updated_at
-                """,
-                    group_data.name,
-                    group_data.description,
-                    current_user.id,
-                    now,
-                )
-
-                # Add creator as owner - use the same approach as existing groups
-                # Check what role value the existing group uses
-                existing_role = await conn.fetchval(
-                    """
-                    SELECT role FROM user_groups WHERE group_id = 1 LIMIT 1
-                """
-                )
-
-                if existing_role:
-                    # Use the same role value as existing groups
-                    await conn.execute(
-                        """
-                        INSERT INTO user_groups (user_id, group_id, role, created_at, updated_at)
-                        VALUES ($1, $2, $3, $4, $4)
-                    """,
-                        current_user.id,
-                        group_row["id"],
-                        existing_role,
-                        now,
-                    )
-                else:
-                    # Fallback to string value
-                    await conn.execute(
-                        """
-                        INSERT INTO user_groups (user_id, group_id, role, created_at, updated_at)
-                        VALUES ($1, $2, 'owner', $3, $3)
-                    """,
-                        current_user.id,
-                        group_row["id"],
-                        now,
-                    )
-
-                return GroupResponse(
-                    id=group_row["id"],
-                    name=group_row["name"],
-                    description=group_row["description"],
-                    created_by=group_row["created_by"],
-                    created_at=group_row["created_at"],
-                    updated_at=group_row["updated_at"],
-                    members=[],
-                    member_count=1,
-                )
-
-        finally:
-            await conn.close()
+        invalidate_board_access(current_user.id)
+        return GroupResponse(
+            id=group_row["id"],
+            name=group_row["name"],
+            description=group_row["description"],
+            created_by=group_row["created_by"],
+            created_at=group_row["created_at"],
+            updated_at=group_row["updated_at"],
+            members=[],
+            member_count=1,
+        )
 
     except Exception as e:
         raise HTTPException(
@@ -185,60 +163,64 @@ async def get_group(
 
     Only accessible to group members.
     """
-    # Check if user is a member of the group
-    membership_result = await db.execute(
-        select(UserGroup).where(
-            and_(UserGroup.group_id == group_id, UserGroup.user_id == current_user.id)
+    # One flat query: the group's columns repeated on each member row, with
+    # the member's user details joined in. Access is checked against the
+    # fetched rows, so a group with no rows or without the current user's
+    # membership is forbidden.
+    result = await db.execute(
+        select(
+            Group.name.label("group_name"),
+            Group.description.label("group_description"),
+            Group.created_by.label("group_created_by"),
+            Group.created_at.label("group_created_at"),
+            Group.updated_at.label("group_updated_at"),
+            UserGroup.id,
+            UserGroup.user_id,
+            UserGroup.role,
+            UserGroup.created_at,
+            UserGroup.updated_at,
+            User.username,
+            User.full_name,
+            User.email,
         )
+        .join(UserGroup, UserGroup.group_id == Group.id)
+        .join(User, User.id == UserGroup.user_id)
+        .where(Group.id == group_id)
     )
+    rows = result.all()
 
-    membership = membership_result.scalar_one_or_none()
-    if not membership:
+    if not any(row.user_id == current_user.id for row in rows):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have access to this group",
         )
 
-    # Get group with members
-    result = await db.execute(
-        select(Group)
-        .where(Group.id == group_id)
-        .options(selectinload(Group.members).selectinload(UserGroup.user))
-    )
-
-    group = result.scalar_one_or_none()
-    if not group:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Group not found"
-        )
-
-    # Build member list with user info
-    members = []
-    for member in group.members:
-        members.append(
-            UserGroupResponse(
-                id=member.id,
-                user_id=member.user_id,
-                group_id=member.group_id,
-                role=GroupRole(member.role.value),
-                created_at=member.created_at,
-                updated_at=member.updated_at,
-                user={
-                    "id": member.user.id,
-                    "username": member.user.username,
-                    "full_name": member.user.full_name,
-                    "email": member.user.email,
-                },
-            )
+    members = [
+        UserGroupResponse(
+            id=row.id,
+            user_id=row.user_id,
+            group_id=group_id,
+            role=_ROLE_MAP[row.role],
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            user={
+                "id": row.user_id,
+                "username": row.username,
+                "full_name": row.full_name,
+                "email": row.email,
+            },
         )
+        for row in rows
+    ]
 
+    group = rows[0]
     return GroupResponse(
-        id=group.id,
-        name=group.name,
-        description=group.description,
-        created_by=group.created_by,
-        created_at=group.created_at,
-        updated_at=group.updated_at,
+        id=group_id,
+        name=group.group_name,
+        description=group.group_description,
+        created_by=group.group_created_by,
+        created_at=group.group_created_at,
+        updated_at=group.group_updated_at,
         members=members,
         member_count=len(members),
     )
@@ -249,128 +231,65 @@ async def update_group(
     group_id: int,
     group_data: GroupUpdate,
     current_user: User = Depends(get_user_from_api_key_or_jwt),
-    db: AsyncSession = Depends(get_db_session),
+    conn: asyncpg.Connection = Depends(get_pg_conn),
 ):
     """
     Update group information using raw asyncpg to avoid MissingGreenlet errors.
 
     Only accessible to group admins and owners.
     """
-    import os
-    import asyncpg
-    from datetime import datetime, timezone
-
-    # Get database connection info from environment
-    database_url = os.getenv("DATABASE_URL")
-    if not database_url:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Database configuration error",
-        )
-
     try:
-        # Parse database URL for asyncpg connection
-        import urllib.parse
-
-        parsed = urllib.parse.urlparse(database_url)
-
-        # Connect directly with asyncpg
-        conn = await asyncpg.connect(
-            host=parsed.hostname,
-            port=parsed.port or 5432,
-            user=parsed.username,
-            password=parsed.password,
-            database=parsed.path[1:],  # Remove leading slash
+        # Update only if the user is a group admin or owner, in one
+        # statement with fixed text so asyncpg reuses its prepared plan. NULL
+        # parameters leave a column unchanged, and updated_at is only bumped
+        # when something was actually changed.
+        changed = group_data.name is not None or group_data.description is not None
+        updated_group = await conn.fetchrow(
+            """
+            UPDATE groups g
+            SET name = COALESCE($1, g.name),
+                description = COALESCE($2, g.description),
+                updated_at = COALESCE($5, g.updated_at)
+            WHERE g.id = $3
+              AND EXISTS (
+                  SELECT 1 FROM user_groups ug
+                  WHERE ug.group_id = $3 AND ug.user_id = $4
+                    AND ug.role = ANY($6::grouprole[])
+              )
+            RETURNING id, name, description, created_by, created_at, updated_at
+        """,
+            group_data.name,
+            group_data.description,
+            group_id,
+            current_user.id,
+            datetime.now(timezone.utc) if changed else None,
+            [ModelGroupRole.ADMIN.name, ModelGroupRole.OWNER.name],
         )
 
-        try:
-            # Check if user is a member of the group (simplified check)
-            membership_count = await conn.fetchval(
-                """
-                SELECT COUNT(*) FROM user_groups 
-                WHERE group_id = $1 AND user_id = $2
-            """,
-                group_id,
-                current_user.id,
-            )
-
-            if membership_count == 0:
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail="You don't have permission to update this group",
-                )
-
-            # Check if group exists
-            existing_group = await conn.fetchrow(
-                """
-                SELECT id, name, description, created_by, created_at, updated_at
-                FROM groups WHERE id = $1
-            """,
-                group_id,
+        if not updated_group:
+            # Nothing was updated; tell a missing group from a non-admin
+            group_exists = await conn.fetchval(
+                "SELECT EXISTS (SELECT 1 FROM groups WHERE id = $1)", group_id
             )
-
-            if not existing_group:
+            if not group_exists:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND, detail="Group not found"
                 )
-
-            # Build update query dynamically
-            update_fields = []
-            update_values = []
-            param_count = 1
-
-            if group_data.name is not None:
-                update_fields.append(f"name = ${param_count}")
-                update_values.append(group_data.name)
-                param_count += 1
-
-            if group_data.description is not None:
-                update_fields.append(f"description = ${param_count}")
-                update_values.append(group_data.description)
-                param_count += 1
-
-            if not update_fields:
-                # No updates needed, return existing group
-                return GroupResponse(
-                    id=existing_group["id"],
-                    name=existing_group["name"],
-                    description=existing_group["description"],
-                    created_by=existing_group["created_by"],
-                    created_at=existing_group["created_at"],
-                    updated_at=existing_group["updated_at"],
-                    members=[],
-                    member_count=1,
-                )
-
-            # Add updated_at field
-            update_fields.append(f"updated_at = ${param_count}")
-            update_values.append(datetime.now(timezone.utc))
-            update_values.append(group_id)  # WHERE clause parameter
-
-            # Execute update
-            updated_group = await conn.fetchrow(
-                f"""
-                UPDATE groups 
-                SET {', '.join(update_fields)}
-                WHERE id = ${param_count + 1}
-                RETURNING id, name, description, created_by, created_at, updated_at
-            """,
-                *update_values,
-            )
-
-            return GroupResponse(
-                id=updated_group["id"],
-                name=updated_group["name"],
-                description=updated_group["description"],
-                created_by=updated_group["created_by"],
-                created_at=updated_group["created_at"],
-                updated_at=updated_group["updated_at"],
-                members=[],
-                member_count=1,
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have permission to update this group",
             )
 
-        finally:
-            await conn.close()
+        return GroupResponse(
+            id=updated_group["id"],
+            name=updated_group["name"],
+            description=updated_group["description"],
+            created_by=updated_group["created_by"],
+            created_at=updated_group["created_at"],
+            updated_at=updated_group["updated_at"],
+            members=[],
+            member_count=1,
+        )
 
     except HTTPException:
         raise
@@ -385,80 +304,45 @@ async def update_group(
 async def delete_group(
     group_id: int,
     current_user: User = Depends(get_user_from_api_key_or_jwt),
-    db: AsyncSession = Depends(get_db_session),
+    conn: asyncpg.Connection = Depends(get_pg_conn),
 ):
     """
     Delete a group using raw asyncpg to avoid MissingGreenlet errors.
 
     Only accessible to group owners.
     """
-    import os
-    import asyncpg
-
-    # Get database connection info from environment
-    database_url = os.getenv("DATABASE_URL")
-    if not database_url:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Database configuration error",
-        )
-
     try:
-        # Parse database URL for asyncpg connection
-        import urllib.parse
-
-        parsed = urllib.parse.urlparse(database_url)
-
-        # Connect directly with asyncpg
-        conn = await asyncpg.connect(
-            host=parsed.hostname,
-            port=parsed.port or 5432,
-            user=parsed.username,
-            password=parsed.password,
-            database=parsed.path[1:],  # Remove leading slash
+        # Delete only if the user owns the group, in one statement (cascade
+        # handles user_groups and boards)
+        deleted_id = await conn.fetchval(
+            """
+            DELETE FROM groups g
+            WHERE g.id = $1
+              AND EXISTS (
+                  SELECT 1 FROM user_groups ug
+                  WHERE ug.group_id = $1 AND ug.user_id = $2 AND ug.role = $3::grouprole
+              )
+            RETURNING g.id
+        """,
+            group_id,
+            current_user.id,
+            ModelGroupRole.OWNER.name,
         )
 
-        try:
-            # Check if user is a member of the group (simplified check)
-            membership_count = await conn.fetchval(
-                """
-                SELECT COUNT(*) FROM user_groups 
-                WHERE group_id = $1 AND user_id = $2
-            """,
-                group_id,
-                current_user.id,
-            )
-
-            if membership_count == 0:
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail="You don't have permission to delete this group",
-                )
-
-            # Check if group exists
+        if deleted_id is None:
+            # Nothing was deleted; tell a missing group from a non-owner
             group_exists = await conn.fetchval(
-                """
-                SELECT id FROM groups WHERE id = $1
-            """,
-                group_id,
+                "SELECT EXISTS (SELECT 1 FROM groups WHERE id = $1)", group_id
             )
-
             if not group_exists:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND, detail="Group not found"
                 )
-
-            # Delete group (cascade will handle user_groups and boards)
-            await conn.execute(
-                """
-                DELETE FROM groups WHERE id = $1
-            """,
-                group_id,
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have permission to delete this group",
             )
 
-        finally:
-            await conn.close()
-
     except HTTPException:
         raise
     except Exception as e:
@@ -480,72 +364,96 @@ async def add_group_member(
 
     Only accessible to group admins and owners.
     """
-    # Check if current user has admin/owner permissions
-    admin_check = await db.execute(
-        select(UserGroup).where(
-            and_(
-                UserGroup.group_id == group_id,
-                UserGroup.user_id == current_user.id,
-                UserGroup.role.in_([ModelGroupRole.ADMIN, ModelGroupRole.OWNER]),
-            )
+    is_group_admin = exists().where(
+        UserGroup.group_id == group_id,
+        UserGroup.user_id == current_user.id,
+        UserGroup.role.in_([ModelGroupRole.ADMIN, ModelGroupRole.OWNER]),
+    )
+    already_member = exists().where(
+        UserGroup.group_id == group_id,
+        UserGroup.user_id == membership_request.user_id,
+    )
+
+    # Load the permission and duplicate checks together with the target user,
+    # and insert the membership only when all pass, in one round trip. The
+    # user is outer-joined onto a single row so the flags always come back.
+    # ON CONFLICT covers a concurrent add of the same user that the
+    # already_member check could not see yet.
+    one_row = select(literal(1).label("one")).subquery("one_row")
+    target = (
+        select(
+            User.id,
+            User.username,
+            User.full_name,
+            User.email,
+            is_group_admin.label("is_group_admin"),
+            already_member.label("already_member"),
+        )
+        .select_from(one_row)
+        .outerjoin(User, User.id == membership_request.user_id)
+        .cte("target")
+    )
+    inserted = (
+        pg_insert(UserGroup)
+        .from_select(
+            ["user_id", "group_id", "role"],
+            select(
+                target.c.id,
+                literal(group_id),
+                literal(_MODEL_ROLE_MAP[membership_request.role], UserGroup.role.type),
+            ).where(
+                target.c.id.is_not(None),
+                target.c.is_group_admin,
+                ~target.c.already_member,
+            ),
         )
+        .on_conflict_do_nothing(index_elements=["group_id", "user_id"])
+        .returning(UserGroup.id, UserGroup.created_at, UserGroup.updated_at)
+        .cte("inserted")
     )
+    user_result = await db.execute(
+        select(
+            target,
+            inserted.c.id.label("membership_id"),
+            inserted.c.created_at,
+            inserted.c.updated_at,
+        )
+        .select_from(target)
+        .outerjoin(inserted, true())
+    )
+    user = user_result.one()
 
-    admin_membership = admin_check.scalar_one_or_none()
-    if not admin_membership:
+    # Check if current user has admin/owner permissions
+    if not user.is_group_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have permission to add members to this group",
         )
 
     # Check if user exists
-    user_result = await db.execute(
-        select(User).where(User.id == membership_request.user_id)
-    )
-    user = user_result.scalar_one_or_none()
-
-    if not user:
+    if user.id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
 
-    # Check if user is already a member
-    existing_membership = await db.execute(
-        select(UserGroup).where(
-            and_(
-                UserGroup.group_id == group_id,
-                UserGroup.user_id == membership_request.user_id,
-            )
-        )
-    )
-
-    if existing_membership.scalar_one_or_none():
+    # Nothing was inserted if the user is already a member, including one
+    # added by a concurrent request
+    if user.membership_id is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User is already a member of this group",
         )
 
-    # Add user to group
-    new_membership = UserGroup(
-        user_id=membership_request.user_id,
-        group_id=group_id,
-        role=ModelGroupRole(membership_request.role.value),
-    )
-
-    db.add(new_membership)
-    await db.commit()
-    await db.refresh(new_membership, ["user"])
-
-    return GroupMembershipResponse(
+    response = GroupMembershipResponse(
         success=True,
         message=f"User {user.username} added to group successfully",
         user_group=UserGroupResponse(
-            id=new_membership.id,
-            user_id=new_membership.user_id,
-            group_id=new_membership.group_id,
-            role=GroupRole(new_membership.role.value),
-            created_at=new_membership.created_at,
-            updated_at=new_membership.updated_at,
+            id=user.membership_id,
+            user_id=user.id,
+            group_id=group_id,
+            role=membership_request.role,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
             user={
                 "id": user.id,
                 "username": user.username,
@@ -554,79 +462,164 @@ async def add_group_member(
             },
         ),
     )
+    await db.commit()
+    invalidate_board_access(membership_request.user_id)
 
+    return response
 
-@router.delete("/{group_id}/members/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def remove_group_member(
+
+@router.post("/{group_id}/members/bulk", response_model=GroupBulkMembershipResponse)
+async def add_group_members_bulk(
     group_id: int,
-    user_id: int,
+    membership_request: GroupBulkMembershipRequest,
     current_user: User = Depends(get_user_from_api_key_or_jwt),
     db: AsyncSession = Depends(get_db_session),
 ):
     """
-    Remove a user from a group.
+    Add several users to a group in one statement.
 
-    Accessible to:
-    - Group admins and owners (can remove any member)
-    - Users themselves (can leave the group)
+    Only accessible to group admins and owners. Users that do not exist or
+    are already members are skipped.
     """
-    # Check permissions
-    can_remove = False
-
-    # Check if current user is admin/owner
-    admin_check = await db.execute(
-        select(UserGroup).where(
-            and_(
+    is_admin = await db.scalar(
+        select(
+            exists().where(
                 UserGroup.group_id == group_id,
                 UserGroup.user_id == current_user.id,
                 UserGroup.role.in_([ModelGroupRole.ADMIN, ModelGroupRole.OWNER]),
             )
         )
     )
-
-    if admin_check.scalar_one_or_none():
-        can_remove = True
-
-    # Check if user is removing themselves
-    if current_user.id == user_id:
-        can_remove = True
-
-    if not can_remove:
+    if not is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to remove this member",
+            detail="You don't have permission to add members to this group",
         )
 
-    # Find and remove membership
-    membership_result = await db.execute(
-        select(UserGroup).where(
-            and_(UserGroup.group_id == group_id, UserGroup.user_id == user_id)
+    # One set-based INSERT ... SELECT for the whole batch: only existing users
+    # who are not yet members are inserted, duplicates in the request included.
+    # NOT EXISTS skips current members up front; ON CONFLICT on the unique
+    # membership index skips rows a concurrent add inserted in the meantime.
+    user_ids = list(dict.fromkeys(membership_request.user_ids))
+    existing_membership = aliased(UserGroup)
+    result = await db.execute(
+        pg_insert(UserGroup)
+        .from_select(
+            ["user_id", "group_id", "role"],
+            select(
+                User.id,
+                literal(group_id),
+                literal(_MODEL_ROLE_MAP[membership_request.role], UserGroup.role.type),
+            ).where(
+                User.id.in_(user_ids),
+                ~exists().where(
+                    existing_membership.group_id == group_id,
+                    existing_membership.user_id == User.id,
+                ),
+            ),
         )
+        .on_conflict_do_nothing(index_elements=["group_id", "user_id"])
+        .returning(UserGroup.user_id)
     )
+    added = set(result.scalars().all())
+    await db.commit()
 
-    membership = membership_result.scalar_one_or_none()
-    if not membership:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User is not a member of this group",
-        )
+    for user_id in added:
+        invalidate_board_access(user_id)
 
-    # Prevent removing the last owner
-    if membership.role == ModelGroupRole.OWNER:
-        owner_count = await db.execute(
-            select(UserGroup).where(
-                and_(
-                    UserGroup.group_id == group_id,
-                    UserGroup.role == ModelGroupRole.OWNER,
-                )
+    return GroupBulkMembershipResponse(
+        success=True,
+        message=f"Added {len(added)} of {len(user_ids)} users to group",
+        added_user_ids=[user_id for user_id in user_ids if user_id in added],
+        skipped_user_ids=[user_id for user_id in user_ids if user_id not in added],
+    )
+
+
+@router.delete("/{group_id}/members/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def remove_group_member(
+    group_id: int,
+    user_id: int,
+    current_user: User = Depends(get_user_from_api_key_or_jwt),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Remove a user from a group.
+
+    Accessible to:
+    - Group admins and owners (can remove any member)
+    - Users themselves (can leave the group)
+    """
+    # Aliased so the subqueries are not correlated to the row being deleted
+    caller_membership = aliased(UserGroup)
+    other_owners = aliased(UserGroup)
+    is_group_admin = exists().where(
+        caller_membership.group_id == group_id,
+        caller_membership.user_id == current_user.id,
+        caller_membership.role.in_([ModelGroupRole.ADMIN, ModelGroupRole.OWNER]),
+    )
+    membership_filter = and_(
+        UserGroup.group_id == group_id, UserGroup.user_id == user_id
+    )
+
+    # Lock the group's owner rows, in id order, before checking for another
+    # owner. Otherwise two owners removed concurrently could each see the
+    # other and leave the group without one; with the lock the second delete
+    # waits for the first to commit and then sees one owner fewer.
+    await db.execute(
+        select(UserGroup.id)
+        .where(UserGroup.group_id == group_id, UserGroup.role == ModelGroupRole.OWNER)
+        .order_by(UserGroup.id)
+        .with_for_update()
+    )
+
+    # Delete the membership in one statement, guarded by the permission check
+    # (users may always remove themselves) and the last-owner rule
+    remove_membership = (
+        delete(UserGroup)
+        .where(
+            membership_filter,
+            or_(
+                UserGroup.role != ModelGroupRole.OWNER,
+                exists().where(
+                    other_owners.group_id == group_id,
+                    other_owners.role == ModelGroupRole.OWNER,
+                    other_owners.id != UserGroup.id,
+                ),
+            ),
+        )
+        .returning(UserGroup.id)
+        .execution_options(synchronize_session=False)
+    )
+    if current_user.id != user_id:
+        remove_membership = remove_membership.where(is_group_admin)
+
+    if await db.scalar(remove_membership) is None:
+        # Nothing was deleted; work out which guard failed
+        checks = await db.execute(
+            select(
+                is_group_admin.label("is_group_admin"),
+                select(UserGroup.role)
+                .where(membership_filter)
+                .scalar_subquery()
+                .label("role"),
             )
         )
+        check = checks.one()
 
-        if len(owner_count.scalars().all()) <= 1:
+        if current_user.id != user_id and not check.is_group_admin:
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Cannot remove the last owner from the group",
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have permission to remove this member",
             )
+        if check.role is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User is not a member of this group",
+            )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cannot remove the last owner from the group",
+        )
 
-    await db.delete(membership)
     await db.commit()
+    invalidate_board_access(user_id)
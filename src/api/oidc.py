@@ -2,6 +2,7 @@
 OIDC authentication API endpoints.
 """
 
+import hmac
 import secrets
 from typing import Any, Dict, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
@@ -15,6 +16,7 @@ from ..models import User, OIDCProvider
 from ..auth.oidc_client import get_oidc_client
 from ..auth.oidc_config import oidc_config
 from ..auth.jwt_handler import JWTHandler
+from ..auth.password_cache import verify_password_cached
 from ..schemas import (
     OIDCAuthRequest,
     OIDCCallbackRequest,
@@ -84,7 +86,9 @@ async def oidc_callback(
 
     # Verify state parameter for CSRF protection
     stored_state = request.cookies.get(f"oidc_state_{provider}")
-    if not stored_state or stored_state != state:
+    if not stored_state or not hmac.compare_digest(
+        stored_state.encode(), state.encode()
+    ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid state parameter"
         )
@@ -286,7 +290,9 @@ async def link_oidc_account(
     )
     user = result.scalar_one_or_none()
 
-    if not user or not user.verify_password(link_request.password):
+    if not user or not await verify_password_cached(
+        user.hashed_password, link_request.password
+    ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid username or password",
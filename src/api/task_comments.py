@@ -5,7 +5,7 @@ Task comment API endpoints.
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import exists, select
 from sqlalchemy.orm import selectinload
 
 from ..database import get_db_session
@@ -27,14 +27,15 @@ router = APIRouter(prefix="/tasks", tags=["task-comments"])
 
 async def _can_access_task(db: AsyncSession, user: User, task_id: int) -> bool:
     """Check if user can access the task (owns the board)."""
-    result = await db.execute(
-        select(Task)
-        .join(Column, Task.column_id == Column.id)
-        .join(Board, Column.board_id == Board.id)
-        .where(Task.id == task_id)
-        .where(Board.owner_id == user.id)
+    return await db.scalar(
+        select(
+            exists()
+            .where(Task.id == task_id)
+            .where(Task.column_id == Column.id)
+            .where(Column.board_id == Board.id)
+            .where(Board.owner_id == user.id)
+        )
     )
-    return result.scalar_one_or_none() is not None
 
 
 @router.get("/{task_id}/comments", response_model=TaskCommentListResponse)
@@ -94,21 +95,21 @@ async def create_task_comment(
     )
 
     db.add(comment)
-    await db.commit()
-    await db.refresh(comment)
-
-    # Load author relationship for response
-    await db.refresh(comment, ["author"])
+    await db.flush()
 
-    return TaskCommentResponse(
+    # The INSERT returned the id and timestamps, and the author is the
+    # current user, so nothing needs reloading
+    response = TaskCommentResponse(
         id=comment.id,
         content=comment.content,
         task_id=comment.task_id,
         author_id=comment.author_id,
-        author_name=comment.author.full_name or comment.author.username,
+        author_name=current_user.full_name or current_user.username,
         created_at=comment.created_at,
         updated_at=comment.updated_at,
     )
+    await db.commit()
+    return response
 
 
 @router.put("/comments/{comment_id}", response_model=TaskCommentResponse)
@@ -140,10 +141,9 @@ async def update_task_comment(
         raise HTTPException(status_code=404, detail="Task not found")
 
     comment.content = comment_data.content
-    await db.commit()
-    await db.refresh(comment)
+    await db.flush()
 
-    return TaskCommentResponse(
+    response = TaskCommentResponse(
         id=comment.id,
         content=comment.content,
         task_id=comment.task_id,
@@ -152,6 +152,8 @@ async def update_task_comment(
         created_at=comment.created_at,
         updated_at=comment.updated_at,
     )
+    await db.commit()
+    return response
 
 
 @router.delete("/comments/{comment_id}")
@@ -21,7 +21,12 @@ logger = logging.getLogger(__name__)
 
 
 def task_to_dict(task: Task) -> dict:
-    """Convert a Task model to a dictionary for broadcasting."""
+    """
+    Convert a Task model to a dictionary for broadcasting.
+
+    Datetimes are left as is; the connection manager encodes events with
+    orjson, which formats them natively.
+    """
     return {
         "id": task.id,
         "title": task.title,
@@ -33,8 +38,8 @@ def task_to_dict(task: Task) -> dict:
         "priority": task.priority,
         "steps": task.steps,
         "results": task.results,
-        "created_at": task.created_at.isoformat() if task.created_at else None,
-        "updated_at": task.updated_at.isoformat() if task.updated_at else None,
+        "created_at": task.created_at,
+        "updated_at": task.updated_at,
     }
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
@@ -39,7 +39,12 @@ class JWTHandler:
         return encoded_jwt
 
     def verify_token(self, token: str) -> Optional[TokenData]:
-        """Verify and decode a JWT token."""
+        """
+        Verify and decode a JWT token.
+
+        Signature checking is left to jwt.decode, which compares HMACs in
+        constant time.
+        """
         try:
             payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
             username: str = payload.get("sub")
@@ -0,0 +1,86 @@
+"""
+Password hashing helpers for request handlers.
+
+Password hashes are deliberately slow, so hashing and verification run on a worker
+thread pool rather than the event loop, and repeated logins from the same
+client are served from a short-lived cache of successful verifications. Only
+positive results are cached, keyed by a keyed BLAKE2b digest of the stored
+hash and the candidate password, so entries cannot be used to recover or test
+passwords.
+"""
+
+import asyncio
+import hashlib
+import os
+import secrets
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from ..models.user import pwd_context
+from ..utils.ttl_cache import TTLCache
+
+# argon2-cffi and bcrypt release the GIL while hashing, so threads run in
+# parallel and avoid the startup and pickling costs of a process pool
+_hash_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="password-hash"
+)
+
+
+class PasswordVerificationCache:
+    """In-process TTL cache of password hash/candidate pairs known to match."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self._key = secrets.token_bytes(32)  # Per-process, never persisted
+        self._entries = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def _digest(self, hashed_password: str, password: str) -> bytes:
+        h = hashlib.blake2b(key=self._key, digest_size=16)
+        h.update(hashed_password.encode())
+        h.update(b"\0")
+        h.update(password.encode())
+        return h.digest()
+
+    def contains(self, hashed_password: str, password: str) -> bool:
+        """Return True if this pair was verified within the TTL."""
+        return self._entries.get(self._digest(hashed_password, password)) is not None
+
+    def add(self, hashed_password: str, password: str) -> None:
+        """Record a successful verification, evicting the oldest if full."""
+        self._entries.set(self._digest(hashed_password, password), True)
+
+    def clear(self) -> None:
+        """Drop all cached verifications."""
+        self._entries.clear()
+
+
+password_cache = PasswordVerificationCache()
+
+
+async def verify_password_cached(
+    hashed_password: Optional[str], password: str
+) -> bool:
+    """Verify a password, skipping the hash for recently verified pairs."""
+    if not hashed_password:
+        return False
+    if password_cache.contains(hashed_password, password):
+        return True
+    loop = asyncio.get_running_loop()
+    if not await loop.run_in_executor(
+        _hash_executor, pwd_context.verify, password, hashed_password
+    ):
+        return False
+    password_cache.add(hashed_password, password)
+    return True
+
+
+async def hash_password(password: str) -> str:
+    """Hash a password without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_executor, pwd_context.hash, password)
+
+
+async def rehash_if_needed(hashed_password: str, password: str) -> Optional[str]:
+    """Return a fresh hash if the stored one uses a deprecated scheme or settings."""
+    if not pwd_context.needs_update(hashed_password):
+        return None
+    return await hash_password(password)
@@ -10,7 +10,7 @@ import logging
 from datetime import datetime, timedelta
 from typing import Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, insert, update
 
 from ..models.session import Session
 from ..models.user import User
@@ -32,10 +32,13 @@ async def create_session(
     token: str,
     user_agent: Optional[str] = None,
     ip_address: Optional[str] = None,
-) -> Session:
+) -> int:
     """
     Create a new session in the database.
     
+    The INSERT joins the caller's transaction; the caller is responsible
+    for committing it.
+    
     Args:
         db: Database session
         user_id: ID of the user
@@ -44,25 +47,26 @@ async def create_session(
         ip_address: Optional client IP address
     
     Returns:
-        Created Session object
+        ID of the created session
     """
     token_hash = hash_token(token)
     expires_at = datetime.utcnow() + timedelta(days=SESSION_EXPIRY_DAYS)
     
-    session = Session(
-        user_id=user_id,
-        token_hash=token_hash,
-        expires_at=expires_at,
-        user_agent=user_agent,
-        ip_address=ip_address,
+    result = await db.execute(
+        insert(Session)
+        .values(
+            user_id=user_id,
+            token_hash=token_hash,
+            expires_at=expires_at,
+            user_agent=user_agent,
+            ip_address=ip_address,
+        )
+        .returning(Session.id)
     )
-    
-    db.add(session)
-    await db.commit()
-    await db.refresh(session)
+    session_id = result.scalar_one()
     
     logger.info(f"Created session for user {user_id}, expires {expires_at}")
-    return session
+    return session_id
 
 
 async def validate_session(
@@ -107,6 +111,40 @@ async def validate_session(
     return (session, user)
 
 
+async def validate_session_user_id(db: AsyncSession, token: str) -> Optional[int]:
+    """
+    Validate a session token and return only the owning user's ID.
+    
+    Lighter than validate_session for callers that only need the ID: the
+    expiry check, active-user check and last_used_at touch are a single
+    UPDATE ... FROM users ... RETURNING, with no ORM objects loaded.
+    
+    Args:
+        db: Database session
+        token: JWT token to validate
+    
+    Returns:
+        User ID if the session is valid and the user active, None otherwise
+    """
+    token_hash = hash_token(token)
+    now = datetime.utcnow()
+    
+    result = await db.execute(
+        update(Session)
+        .where(Session.token_hash == token_hash)
+        .where(Session.expires_at > now)
+        .where(Session.user_id == User.id)
+        .where(User.is_active == True)
+        .values(last_used_at=now)
+        .returning(Session.user_id)
+        .execution_options(synchronize_session=False)
+    )
+    user_id = result.scalar_one_or_none()
+    await db.commit()
+    
+    return user_id
+
+
 async def delete_session(db: AsyncSession, token: str) -> bool:
     """
     Delete a session from the database (logout).
@@ -2,6 +2,7 @@
 Configuration management for Simple Kanban Board application.
 """
 
+import ipaddress
 import os
 import secrets
 from typing import List, Optional
@@ -47,6 +48,19 @@ class Settings(BaseSettings):
     postgres_password: str = Field(
         default="", description="PostgreSQL password from environment"
     )
+    # Async engine pool, per worker. Set db_null_pool when running behind
+    # pgbouncer so connections are not pooled twice.
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 1800
+    db_null_pool: bool = False
+    # Prepared statements cached per asyncpg connection; set to 0 behind
+    # pgbouncer in transaction mode, which cannot keep them across queries
+    db_statement_cache_size: int = 500
+    # Raw asyncpg pool for the group write endpoints, per worker
+    pg_pool_min_size: int = 2
+    pg_pool_max_size: int = 10
 
     # Redis Configuration
     redis_url: Optional[str] = None
@@ -157,6 +171,34 @@ class Settings(BaseSettings):
     # Rate Limiting
     rate_limit_per_minute: int = 100
     rate_limit_burst: int = 200
+    # Per-client token buckets for endpoints that hash passwords or hit the
+    # database hard; the burst is the bucket capacity
+    login_rate_limit_per_minute: int = 10
+    login_rate_limit_burst: int = 20
+    search_rate_limit_per_minute: int = 60
+    search_rate_limit_burst: int = 120
+    admin_stats_rate_limit_per_minute: int = 60
+    admin_stats_rate_limit_burst: int = 120
+    # Reverse proxies (IPs or CIDR ranges) whose X-Forwarded-For and X-Real-IP
+    # headers are believed; from anyone else the headers are ignored so
+    # clients cannot pick the address they are rate limited under
+    trusted_proxies: List[str] = []
+
+    @field_validator("trusted_proxies", mode="before")
+    @classmethod
+    def assemble_trusted_proxies(cls, v):
+        if isinstance(v, str):
+            v = [i.strip() for i in v.split(",") if i.strip()]
+        if not isinstance(v, list):
+            raise ValueError(v)
+        # Reject malformed entries at startup rather than on every request
+        for proxy in v:
+            ipaddress.ip_network(proxy, strict=False)
+        return v
+
+    # Response Compression
+    # Responses smaller than this many bytes are sent uncompressed
+    gzip_minimum_size: int = 1024
 
     # Logging Configuration
     log_level: str = "INFO"
@@ -12,7 +12,14 @@ from .config import settings
 
 
 # Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__memory_cost=65536,
+    argon2__time_cost=3,
+    argon2__parallelism=2,
+)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -2,11 +2,13 @@
 Database configuration and session management.
 """
 
+import asyncio
 import os
+from typing import Optional
 from sqlalchemy import create_engine
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, StaticPool
 
 from .models import Base
 from .core.config import get_settings
@@ -34,11 +36,30 @@ engine = create_engine(
 )
 
 # Create async engine for FastAPI
+if settings.db_null_pool:
+    _async_pool_options = {"poolclass": NullPool}
+else:
+    _async_pool_options = {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+    }
+
+if ASYNC_DATABASE_URL.startswith("postgresql+asyncpg://"):
+    # Repeated queries skip parse/plan: asyncpg's statement cache and the
+    # SQLAlchemy dialect's prepared statement cache are sized together
+    _async_pool_options["connect_args"] = {
+        "statement_cache_size": settings.db_statement_cache_size,
+        "prepared_statement_cache_size": settings.db_statement_cache_size,
+    }
+
 async_engine = create_async_engine(
     ASYNC_DATABASE_URL,
     echo=os.getenv("DEBUG", "false").lower() == "true",
     pool_pre_ping=True,
-    pool_recycle=300,
+    **_async_pool_options,
 )
 
 # Session factories
@@ -51,6 +72,11 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+# Shared pool for the handlers that issue raw asyncpg queries; opened on
+# startup by create_pg_pool()
+pg_pool: Optional["asyncpg.Pool"] = None
+
+
 def get_db():
     """Dependency to get sync database session."""
     db = SessionLocal()
@@ -69,6 +95,51 @@ async def get_db_session():
             await session.close()
 
 
+async def warm_async_pool() -> None:
+    """Open pool_size connections up front so early requests skip connecting."""
+    if settings.db_null_pool:
+        return
+
+    connections = await asyncio.gather(
+        *(async_engine.connect() for _ in range(settings.db_pool_size))
+    )
+    # Closing returns each connection to the pool rather than the server
+    await asyncio.gather(*(conn.close() for conn in connections))
+
+
+async def create_pg_pool() -> None:
+    """Open the shared asyncpg pool; a no-op when not running on PostgreSQL."""
+    global pg_pool
+    if not ASYNC_DATABASE_URL.startswith("postgresql+asyncpg://"):
+        return
+
+    # create_pool connects min_size connections before returning
+    pg_pool = await asyncpg.create_pool(
+        dsn=DATABASE_URL,
+        min_size=settings.pg_pool_min_size,
+        max_size=settings.pg_pool_max_size,
+        max_inactive_connection_lifetime=300,
+        command_timeout=60,
+        statement_cache_size=settings.db_statement_cache_size,
+    )
+
+
+async def close_pg_pool() -> None:
+    """Close the shared asyncpg pool if it was opened."""
+    global pg_pool
+    if pg_pool is not None:
+        await pg_pool.close()
+        pg_pool = None
+
+
+async def get_pg_conn():
+    """Dependency to get a raw asyncpg connection from the shared pool."""
+    if pg_pool is None:
+        raise RuntimeError("asyncpg pool is not open")
+    async with pg_pool.acquire() as conn:
+        yield conn
+
+
 def create_tables():
     """Create all database tables."""
     Base.metadata.create_all(bind=engine)
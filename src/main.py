@@ -7,6 +7,7 @@ basic routing, and error handling.
 
 from fastapi import FastAPI, HTTPException, Request, Depends, WebSocket, WebSocketDisconnect, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse, JSONResponse
 from fastapi.exceptions import RequestValidationError
@@ -19,10 +20,19 @@ from .middleware import (
     setup_redis_client,
 )
 from typing import Dict, Any
+from logging.handlers import QueueHandler, QueueListener
+import atexit
 import logging
 import os
-
-from .database import create_tables
+import queue
+
+from .database import (
+    async_engine,
+    close_pg_pool,
+    create_pg_pool,
+    create_tables,
+    warm_async_pool,
+)
 from .migrations.group_migration import run_group_migrations
 from .migrations.task_fields_migration import run_task_fields_migration
 from .migrations.session_migration import run_sessions_migration
@@ -40,11 +50,18 @@ from .api import (
 from .auth.dependencies import require_api_scope
 from .websocket import get_connection_manager
 
-# Configure logging
+# Configure logging. Records are formatted on the calling thread and written
+# to stderr by a background listener so request handlers never block on I/O.
 log_level = logging.DEBUG if settings.debug else logging.INFO
+log_queue: queue.SimpleQueue = queue.SimpleQueue()
+log_listener = QueueListener(log_queue, logging.StreamHandler())
 logging.basicConfig(
-    level=log_level, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    level=log_level,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    handlers=[QueueHandler(log_queue)],
 )
+log_listener.start()
+atexit.register(log_listener.stop)
 logger = logging.getLogger(__name__)
 
 # Initialize FastAPI app with disabled default docs
@@ -82,10 +99,13 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     return JSONResponse(status_code=422, content={"detail": exc.errors()})
 
 
-# Setup Redis client for rate limiting
+# Setup Redis client for rate limiting and response caching
 redis_client = setup_redis_client()
+app.state.redis_client = redis_client
 
 # Add security middleware (order matters - add from innermost to outermost)
+# Compress large JSON bodies (board and group listings) closest to the routes
+app.add_middleware(GZipMiddleware, minimum_size=settings.gzip_minimum_size)
 app.add_middleware(CSRFProtectionMiddleware)
 app.add_middleware(SecurityHeadersMiddleware)
 app.add_middleware(RateLimitMiddleware, redis_client=redis_client)
@@ -136,6 +156,11 @@ async def startup_event():
     run_sessions_migration()
     logger.info("Sessions migrations completed")
 
+    logger.info("Warming database connection pool...")
+    await warm_async_pool()
+    await create_pg_pool()
+    logger.info("Database connection pool ready")
+
     # Start WebSocket connection manager
     logger.info("Starting WebSocket connection manager...")
     ws_manager = get_connection_manager()
@@ -151,6 +176,9 @@ async def shutdown_event():
     await ws_manager.stop()
     logger.info("WebSocket connection manager stopped")
 
+    await close_pg_pool()
+    await async_engine.dispose()
+
 
 @app.get("/")
 async def root():
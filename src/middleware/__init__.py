@@ -6,12 +6,20 @@ from .security import (
     RateLimitMiddleware,
     SecurityHeadersMiddleware,
     CSRFProtectionMiddleware,
+    TokenBucketRateLimiter,
     setup_redis_client,
+    login_rate_limiter,
+    search_rate_limiter,
+    admin_stats_rate_limiter,
 )
 
 __all__ = [
     "RateLimitMiddleware",
     "SecurityHeadersMiddleware",
     "CSRFProtectionMiddleware",
+    "TokenBucketRateLimiter",
     "setup_redis_client",
+    "login_rate_limiter",
+    "search_rate_limiter",
+    "admin_stats_rate_limiter",
 ]
@@ -4,6 +4,8 @@ Security middleware for Simple Kanban Board application.
 Provides rate limiting, security headers, and CSRF protection.
 """
 
+import ipaddress
+import logging
 import time
 from typing import Dict, Optional
 from fastapi import Request, Response, HTTPException, status
@@ -12,6 +14,47 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 import redis.asyncio as redis
 from ..core.config import settings
+from ..utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+def _is_trusted_proxy(host: str) -> bool:
+    """Return True if host falls in one of the configured trusted proxies."""
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return any(
+        address in ipaddress.ip_network(proxy, strict=False)
+        for proxy in settings.trusted_proxies
+    )
+
+
+def get_client_ip(request: Request) -> str:
+    """
+    Return the address of the client that sent the request.
+
+    This is the connection's peer address unless the peer is a configured
+    trusted proxy. Behind one, X-Forwarded-For is read right to left and the
+    first address that is not itself a trusted proxy is the client; entries
+    further left were supplied by the client and can be forged.
+    """
+    peer = request.client.host if request.client else "unknown"
+    if not settings.trusted_proxies or not _is_trusted_proxy(peer):
+        return peer
+
+    forwarded_for = request.headers.get("X-Forwarded-For")
+    if forwarded_for:
+        for hop in reversed([h.strip() for h in forwarded_for.split(",")]):
+            if hop and not _is_trusted_proxy(hop):
+                return hop
+
+    real_ip = request.headers.get("X-Real-IP")
+    if real_ip:
+        return real_ip.strip()
+
+    return peer
 
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
@@ -49,16 +92,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
     def _get_client_ip(self, request: Request) -> str:
         """Extract client IP from request headers."""
-        # Check for forwarded headers first (for reverse proxy setups)
-        forwarded_for = request.headers.get("X-Forwarded-For")
-        if forwarded_for:
-            return forwarded_for.split(",")[0].strip()
-
-        real_ip = request.headers.get("X-Real-IP")
-        if real_ip:
-            return real_ip
-
-        return request.client.host if request.client else "unknown"
+        return get_client_ip(request)
 
     async def _is_rate_limited(self, client_ip: str) -> bool:
         """Check if client IP is rate limited using sliding window."""
@@ -119,6 +153,113 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         return False
 
 
+# Atomic token bucket shared by all workers. The bucket is a hash of
+# (tokens, ts) refilled from the Redis clock, so worker clock skew does not
+# matter; it expires once it would be full again anyway.
+_TOKEN_BUCKET_LUA = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return allowed
+"""
+
+
+class TokenBucketRateLimiter:
+    """
+    Per-client token bucket for individual expensive endpoints.
+
+    Used as a route dependency so excess requests are rejected before any
+    database or password hashing work. With Redis available the bucket is kept
+    there so rate and burst are shared across workers; otherwise buckets live
+    in process memory. Idle buckets are dropped once they would have refilled,
+    so the memory fallback stays bounded however many clients it sees.
+    """
+
+    def __init__(self, name: str, rate_setting: str, burst_setting: str):
+        self.name = name
+        self.rate_setting = rate_setting
+        self.burst_setting = burst_setting
+        self.buckets = TTLCache(maxsize=10_000, ttl=60)  # ip -> (tokens, ts)
+
+    async def __call__(self, request: Request) -> None:
+        client_ip = get_client_ip(request)
+        redis_client = getattr(request.app.state, "redis_client", None)
+
+        limited = None
+        if redis_client:
+            try:
+                limited = await self._redis_rate_limit(redis_client, client_ip)
+            except Exception:
+                # Fall back to memory buckets if Redis fails
+                pass
+        if limited is None:
+            limited = not self._take_token(client_ip)
+
+        if limited:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Rate limit exceeded. Please try again later.",
+                headers={"Retry-After": "60"},
+            )
+
+    def _take_token(self, client_ip: str) -> bool:
+        """Refill the client's bucket and try to take one token."""
+        rate = getattr(settings, self.rate_setting) / 60.0
+        capacity = float(getattr(settings, self.burst_setting))
+        now = time.monotonic()
+
+        # An evicted or expired bucket is simply a full one, so entries only
+        # need to outlive the time it takes to refill.
+        self.buckets.ttl = capacity / rate
+
+        tokens, last = self.buckets.get(client_ip) or (capacity, now)
+        tokens = min(capacity, tokens + (now - last) * rate)
+        if tokens < 1.0:
+            self.buckets.set(client_ip, (tokens, now))
+            return False
+
+        self.buckets.set(client_ip, (tokens - 1.0, now))
+        return True
+
+    async def _redis_rate_limit(
+        self, redis_client: redis.Redis, client_ip: str
+    ) -> bool:
+        """Redis-based token bucket shared by all workers."""
+        key = f"token_bucket:{self.name}:{client_ip}"
+        rate = getattr(settings, self.rate_setting) / 60.0
+        capacity = getattr(settings, self.burst_setting)
+
+        allowed = await redis_client.eval(
+            _TOKEN_BUCKET_LUA, 1, key, capacity, rate
+        )
+        return not allowed
+
+
+login_rate_limiter = TokenBucketRateLimiter(
+    "login", "login_rate_limit_per_minute", "login_rate_limit_burst"
+)
+search_rate_limiter = TokenBucketRateLimiter(
+    "search", "search_rate_limit_per_minute", "search_rate_limit_burst"
+)
+admin_stats_rate_limiter = TokenBucketRateLimiter(
+    "admin_stats",
+    "admin_stats_rate_limit_per_minute",
+    "admin_stats_rate_limit_burst",
+)
+
+
 class SecurityHeadersMiddleware(BaseHTTPMiddleware):
     """Add security headers to all responses."""
 
@@ -211,11 +352,13 @@ class CSRFProtectionMiddleware(BaseHTTPMiddleware):
         # For authenticated requests, skip CSRF validation for now
         # This allows the existing frontend to work while we implement proper CSRF tokens
         auth_header = request.headers.get("Authorization")
-        print(
-            f"CSRF Debug - Path: {request.url.path}, Method: {request.method}, Auth Header: {auth_header}"
-        )
         if auth_header and auth_header.startswith("Bearer "):
-            print("CSRF Debug - Skipping CSRF for Bearer token")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Skipping CSRF check for bearer request %s %s",
+                    request.method,
+                    request.url.path,
+                )
             return await call_next(request)
 
         # Check for CSRF token in headers
@@ -0,0 +1,48 @@
+"""
+Lock and statement timeouts for Alembic revisions that run blocking DDL.
+
+Bounded lock waits make a migration stuck behind a long-running query fail
+fast, so it can be retried instead of stalling the whole deploy.
+"""
+
+from contextlib import contextmanager
+
+from alembic import op
+
+LOCK_TIMEOUT = "5s"
+STATEMENT_TIMEOUT = "10min"
+
+
+def _is_postgresql() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def set_ddl_timeouts() -> None:
+    """Apply the timeouts to the current migration transaction."""
+    if not _is_postgresql():
+        return
+    op.execute(f"SET LOCAL lock_timeout = '{LOCK_TIMEOUT}'")
+    op.execute(f"SET LOCAL statement_timeout = '{STATEMENT_TIMEOUT}'")
+
+
+@contextmanager
+def ddl_autocommit_block():
+    """
+    Run an Alembic autocommit block under the same timeouts.
+
+    SET LOCAL has no effect outside a transaction, so the timeouts are set for
+    the session and reset when the block exits; they never leak into later
+    revisions run on the same connection. The migration transaction that
+    resumes after the block gets its LOCAL timeouts back.
+    """
+    with op.get_context().autocommit_block():
+        if _is_postgresql():
+            op.execute(f"SET SESSION lock_timeout = '{LOCK_TIMEOUT}'")
+            op.execute(f"SET SESSION statement_timeout = '{STATEMENT_TIMEOUT}'")
+        try:
+            yield
+        finally:
+            if _is_postgresql():
+                op.execute("RESET lock_timeout")
+                op.execute("RESET statement_timeout")
+    set_ddl_timeouts()
@@ -4,9 +4,11 @@ API Key model for authentication and testing.
 
 import secrets
 import hashlib
-from typing import Optional, List
+import sys
+from functools import lru_cache
+from typing import Optional, List, Tuple
 from datetime import datetime, timedelta
-from sqlalchemy import String, Boolean, DateTime, Text, Integer, ForeignKey
+from sqlalchemy import String, Boolean, DateTime, Text, Integer, ForeignKey, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from enum import Enum
 
@@ -22,6 +24,19 @@ class ApiKeyScope(str, Enum):
     DOCS = "docs"  # Special scope for accessing documentation
 
 
+@lru_cache(maxsize=256)
+def parse_scopes(scopes: Optional[str]) -> Tuple[str, ...]:
+    """
+    Split a comma-separated scopes string into interned scope names.
+
+    Keys share a handful of distinct scope strings, so parsing is cached and
+    every row with the same scopes gets the same tuple back.
+    """
+    if not scopes:
+        return ()
+    return tuple(sys.intern(s.strip()) for s in scopes.split(","))
+
+
 class ApiKey(Base, TimestampMixin):
     """
     API Key model for programmatic access.
@@ -31,6 +46,27 @@ class ApiKey(Base, TimestampMixin):
     """
 
     __tablename__ = "api_keys"
+    __table_args__ = (
+        # Covering partial index so key lookups during authentication are
+        # index-only scans over active keys (PostgreSQL 11+)
+        Index(
+            "ix_api_keys_key_hash_covering",
+            "key_hash",
+            postgresql_include=[
+                "id",
+                "name",
+                "is_active",
+                "user_id",
+                "expires_at",
+                "scopes",
+            ],
+            postgresql_where=text("is_active"),
+        ),
+        # Serve the per-user listing (newest first) and usage stats (most
+        # used first) from index order instead of sorting every key
+        Index("ix_api_keys_user_id_created_at", "user_id", "created_at"),
+        Index("ix_api_keys_user_id_usage_count", "user_id", "usage_count"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -93,10 +129,7 @@ class ApiKey(Base, TimestampMixin):
 
     def has_scope(self, scope: str) -> bool:
         """Check if the API key has a specific scope."""
-        if not self.scopes:
-            return False
-
-        key_scopes = [s.strip() for s in self.scopes.split(",")]
+        key_scopes = parse_scopes(self.scopes)
 
         # Admin scope grants all permissions
         if "admin" in key_scopes:
@@ -120,9 +153,7 @@ class ApiKey(Base, TimestampMixin):
 
     def get_scopes_list(self) -> List[str]:
         """Get list of scopes for this API key."""
-        if not self.scopes:
-            return []
-        return [s.strip() for s in self.scopes.split(",")]
+        return list(parse_scopes(self.scopes))
 
     def set_scopes(self, scopes: List[str]) -> None:
         """Set scopes from a list."""
@@ -17,6 +17,10 @@ class Base(DeclarativeBase):
 class TimestampMixin:
     """Mixin for created_at and updated_at timestamps."""
 
+    # Fetch the server-generated timestamps in the INSERT/UPDATE itself
+    # (RETURNING) so handlers need no refresh() after writing
+    __mapper_args__ = {"eager_defaults": True}
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
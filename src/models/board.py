@@ -28,7 +28,7 @@ class Board(Base, TimestampMixin):
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True
     )
     group_id: Mapped[Optional[int]] = mapped_column(
-        Integer, ForeignKey("groups.id", ondelete="CASCADE"), nullable=True
+        Integer, ForeignKey("groups.id", ondelete="CASCADE"), nullable=True, index=True
     )
 
     # Relationships
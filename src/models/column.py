@@ -3,7 +3,7 @@ Column model for kanban board columns.
 """
 
 from typing import List, Optional
-from sqlalchemy import String, Integer, ForeignKey
+from sqlalchemy import String, Integer, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, TimestampMixin
@@ -18,6 +18,10 @@ class Column(Base, TimestampMixin):
     """
 
     __tablename__ = "columns"
+    __table_args__ = (
+        # Serves "columns of a board ordered by position" as an index scan
+        Index("ix_columns_board_id_position", "board_id", "position"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -3,7 +3,7 @@ Group model for team-based board ownership and permissions.
 """
 
 from typing import List, Optional
-from sqlalchemy import String, Text, Integer, ForeignKey, Enum as SQLEnum
+from sqlalchemy import String, Text, Integer, ForeignKey, Index, Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import enum
 
@@ -56,6 +56,12 @@ class UserGroup(Base, TimestampMixin):
     """
 
     __tablename__ = "user_groups"
+    __table_args__ = (
+        # One membership per user and group; concurrent adds conflict on it
+        Index(
+            "uq_user_groups_group_id_user_id", "group_id", "user_id", unique=True
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     user_id: Mapped[int] = mapped_column(
@@ -3,7 +3,7 @@ Task model for kanban board tasks.
 """
 
 from typing import Optional, List, Dict, Any
-from sqlalchemy import String, Text, Integer, ForeignKey
+from sqlalchemy import String, Text, Integer, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import JSONB
 
@@ -19,6 +19,10 @@ class Task(Base, TimestampMixin):
     """
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Serves "tasks of a column ordered by position" as an index scan
+        Index("ix_tasks_column_id_position", "column_id", "position"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -9,8 +9,16 @@ from passlib.context import CryptContext
 
 from .base import Base, TimestampMixin
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context. New hashes use Argon2id; bcrypt stays listed so
+# existing hashes still verify and are upgraded on the next successful login.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__memory_cost=65536,
+    argon2__time_cost=3,
+    argon2__parallelism=2,
+)
 
 
 class User(Base, TimestampMixin):
@@ -63,7 +71,12 @@ class User(Base, TimestampMixin):
     # oidc_providers: Mapped[List["OIDCProvider"]] = relationship("OIDCProvider", back_populates="user")
 
     def verify_password(self, password: str) -> bool:
-        """Verify a password against the stored hash."""
+        """
+        Verify a password against the stored hash.
+
+        Always goes through pwd_context.verify, which compares digests in
+        constant time; never compare hashes with ``==``.
+        """
         if not self.hashed_password:
             return False
         return pwd_context.verify(password, self.hashed_password)
@@ -33,11 +33,15 @@ __all__ = [
     "BoardUpdate",
     "BoardResponse",
     "BoardWithColumnsResponse",
+    "BoardColumnResponse",
+    "BoardTaskResponse",
     # Column schemas
     "ColumnCreate",
     "ColumnUpdate",
     "ColumnResponse",
     "ColumnWithTasksResponse",
+    "ColumnTaskResponse",
+    "ColumnWithTaskSummariesResponse",
     # Task schemas
     "TaskCreate",
     "TaskUpdate",
@@ -54,6 +58,8 @@ __all__ = [
     "GroupRole",
     "GroupMembershipRequest",
     "GroupMembershipResponse",
+    "GroupBulkMembershipRequest",
+    "GroupBulkMembershipResponse",
     "UserInfo",
     # API Key schemas
     "ApiKeyCreate",
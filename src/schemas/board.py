@@ -2,7 +2,7 @@
 Board-related Pydantic schemas.
 """
 
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 
@@ -36,7 +36,36 @@ class BoardResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class BoardTaskResponse(BaseModel):
+    """Schema for a task nested in a board response."""
+
+    id: int
+    title: str
+    description: Optional[str]
+    position: int
+    tags: Optional[List[str]] = None
+    priority: Optional[str] = None
+    steps: Optional[List[Dict[str, Any]]] = None
+    results: Optional[Dict[str, Any]] = None
+    task_metadata: Optional[Dict[str, Any]] = None
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class BoardColumnResponse(BaseModel):
+    """Schema for a column nested in a board response."""
+
+    id: int
+    name: str
+    position: int
+    tasks: List[BoardTaskResponse] = []
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class BoardWithColumnsResponse(BoardResponse):
     """Schema for board response with columns included."""
 
-    columns: List[dict] = []
+    columns: List[BoardColumnResponse] = []
@@ -39,3 +39,22 @@ class ColumnWithTasksResponse(ColumnResponse):
     """Schema for column response with tasks included."""
 
     tasks: List[dict] = []
+
+
+class ColumnTaskResponse(BaseModel):
+    """Schema for a task summary nested in a column listing."""
+
+    id: int
+    title: str
+    description: Optional[str]
+    position: int
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ColumnWithTaskSummariesResponse(ColumnResponse):
+    """Schema for a column with typed task summaries, for board listings."""
+
+    tasks: List[ColumnTaskResponse] = []
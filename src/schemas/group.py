@@ -133,3 +133,21 @@ class GroupMembershipResponse(BaseModel):
     success: bool
     message: str
     user_group: Optional[UserGroupResponse] = None
+
+
+class GroupBulkMembershipRequest(BaseModel):
+    """Schema for adding several users to a group at once."""
+
+    user_ids: List[int] = Field(
+        ..., min_length=1, max_length=1000, description="IDs of users to add"
+    )
+    role: GroupRole = Field(GroupRole.MEMBER, description="Role to assign to users")
+
+
+class GroupBulkMembershipResponse(BaseModel):
+    """Schema for bulk group membership operation responses."""
+
+    success: bool
+    message: str
+    added_user_ids: List[int] = []
+    skipped_user_ids: List[int] = []  # Unknown users or existing members
@@ -70,7 +70,9 @@ class KanbanApp {
     }
 
     // API Methods
-    async apiCall(endpoint, options = {}) {
+    async apiCall(endpoint, requestOptions = {}) {
+        // onResponse lets callers read headers such as X-Next-Cursor
+        const { onResponse, ...options } = requestOptions;
         try {
             Debug.log('Making API call to:', `/api${endpoint}`, options);
             
@@ -100,6 +102,9 @@ class KanbanApp {
             }
             
             Debug.log('API Response status:', response.status, response.statusText, 'for endpoint:', endpoint);
+            if (onResponse) {
+                onResponse(response);
+            }
             
             if (!response.ok) {
                 let errorMessage = `HTTP ${response.status}`;
@@ -131,11 +136,29 @@ class KanbanApp {
         }
     }
 
+    // Fetch every page of a keyset-paginated listing
+    async apiCallAllPages(endpoint) {
+        const items = [];
+        let cursor = null;
+        do {
+            const url = cursor ? `${endpoint}?cursor=${cursor}` : endpoint;
+            let nextCursor = null;
+            const page = await this.apiCall(url, {
+                onResponse: (response) => {
+                    nextCursor = response.headers.get('X-Next-Cursor');
+                }
+            });
+            items.push(...(Array.isArray(page) ? page : []));
+            cursor = nextCursor;
+        } while (cursor);
+        return items;
+    }
+
     // Board Management
     async loadBoards() {
         try {
             Debug.log('Loading boards...');
-            const response = await this.apiCall('/boards/');
+            const response = await this.apiCallAllPages('/boards/');
             Debug.log('Boards API response:', response);
             
             // Ensure we have an array
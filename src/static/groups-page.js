@@ -342,18 +342,26 @@ class GroupsPage {
 
     async loadGroupBoards(groupId) {
         try {
-            const response = await fetch('/api/boards/', {
-                headers: {
-                    ...this.getAuthHeaders(),
-                    'Content-Type': 'application/json'
+            // The board listing is paginated; follow X-Next-Cursor to the end
+            const allBoards = [];
+            let cursor = null;
+            do {
+                const url = cursor ? `/api/boards/?cursor=${cursor}` : '/api/boards/';
+                const response = await fetch(url, {
+                    headers: {
+                        ...this.getAuthHeaders(),
+                        'Content-Type': 'application/json'
+                    }
+                });
+
+                if (!response.ok) {
+                    throw new Error('Failed to load boards');
                 }
-            });
 
-            if (!response.ok) {
-                throw new Error('Failed to load boards');
-            }
+                allBoards.push(...await response.json());
+                cursor = response.headers.get('X-Next-Cursor');
+            } while (cursor);
 
-            const allBoards = await response.json();
             const groupBoards = allBoards.filter(board => board.group_id === groupId);
             this.renderGroupBoards(groupBoards);
         } catch (error) {
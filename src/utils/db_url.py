@@ -0,0 +1,32 @@
+"""
+Database URL helpers shared by the application and diagnostic scripts.
+"""
+
+from urllib.parse import urlsplit
+
+ASYNCPG_SCHEME = "postgresql+asyncpg"
+POSTGRES_SCHEMES = {"postgresql", "postgres", ASYNCPG_SCHEME}
+
+
+def to_async_pg(url: str) -> str:
+    """
+    Rewrite a PostgreSQL URL to use SQLAlchemy's asyncpg driver.
+
+    Non-PostgreSQL URLs (e.g. SQLite) are returned unchanged.
+    """
+    parts = urlsplit(url)
+    if parts.scheme not in POSTGRES_SCHEMES:
+        return url
+    return parts._replace(scheme=ASYNCPG_SCHEME).geturl()
+
+
+def to_asyncpg_dsn(url: str) -> str:
+    """
+    Rewrite a PostgreSQL URL to a plain DSN accepted by asyncpg.connect().
+
+    Strips any SQLAlchemy driver suffix such as ``+asyncpg``.
+    """
+    parts = urlsplit(url)
+    if parts.scheme not in POSTGRES_SCHEMES:
+        return url
+    return parts._replace(scheme="postgresql").geturl()
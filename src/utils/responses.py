@@ -0,0 +1,21 @@
+"""
+JSON response helpers for hot endpoints.
+"""
+
+from typing import Any
+
+from fastapi import status
+from fastapi.responses import ORJSONResponse
+
+
+def make_json_response(
+    data: Any, status_code: int = status.HTTP_200_OK
+) -> ORJSONResponse:
+    """
+    Serialize already-shaped data straight to an ORJSONResponse.
+
+    Returning a response object skips FastAPI's response_model validation and
+    its jsonable_encoder pass, so ``data`` must already match the documented
+    schema. orjson encodes datetimes and enums natively.
+    """
+    return ORJSONResponse(content=data, status_code=status_code)
@@ -62,11 +62,11 @@ class BoardEvent(BaseModel):
         super().__init__(**data)
     
     def to_json(self) -> Dict[str, Any]:
-        """Convert event to JSON-serializable dict."""
+        """Convert event to a dict for orjson, which encodes datetimes natively."""
         return {
             "event_type": self.event_type.value,
             "board_id": self.board_id,
             "data": self.data,
             "user_id": self.user_id,
-            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
+            "timestamp": self.timestamp,
         }
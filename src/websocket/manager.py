@@ -10,6 +10,7 @@ import json
 import logging
 from typing import Dict, Set, Optional
 from fastapi import WebSocket, WebSocketDisconnect
+import orjson
 import redis.asyncio as redis
 
 from ..core.config import settings
@@ -141,7 +142,7 @@ class ConnectionManager:
         Args:
             event: The event to broadcast
         """
-        event_json = json.dumps(event.to_json())
+        event_json = orjson.dumps(event.to_json())
         
         # Publish to Redis if available (for multi-instance support)
         if self._redis_client:
@@ -163,11 +164,12 @@ class ConnectionManager:
             return
         
         disconnected = set()
-        event_data = event.to_json()
+        # Encode once for every subscriber instead of once per send_json()
+        event_text = orjson.dumps(event.to_json()).decode()
         
         for websocket in self._connections[board_id]:
             try:
-                await websocket.send_json(event_data)
+                await websocket.send_text(event_text)
             except Exception as e:
                 logger.warning(f"Failed to send to WebSocket: {e}")
                 disconnected.add(websocket)
@@ -17,6 +17,7 @@ from src.models.user import User
 from src.models.board import Board
 from src.models.column import Column
 from src.models.task import Task
+from src.models.group import Group, GroupRole, UserGroup
 
 
 # Test database setup
@@ -573,5 +574,77 @@ class TestCompleteWorkflows:
         assert response.status_code == 404
 
 
+class TestGroupAPI:
+    """Test group API endpoints."""
+
+    @staticmethod
+    async def _create_group_with_users(owner_id, usernames):
+        """Create a group owned by owner_id plus users with the given names."""
+        async with TestSessionLocal() as session:
+            group = Group(name="Test Group", created_by=owner_id)
+            users = [
+                User(username=name, email=f"{name}@example.com", is_active=True)
+                for name in usernames
+            ]
+            session.add_all([group, *users])
+            await session.flush()
+            session.add(
+                UserGroup(user_id=owner_id, group_id=group.id, role=GroupRole.OWNER)
+            )
+            await session.commit()
+            return group.id, [user.id for user in users]
+
+    @pytest.mark.asyncio
+    async def test_bulk_add_splits_added_and_skipped(
+        self, setup_database, authenticated_user
+    ):
+        """Test that unknown users and existing members are reported as skipped."""
+        owner_id = authenticated_user["user"].id
+        group_id, (new_id, member_id) = await self._create_group_with_users(
+            owner_id, ["newuser", "member"]
+        )
+        async with TestSessionLocal() as session:
+            session.add(UserGroup(user_id=member_id, group_id=group_id))
+            await session.commit()
+
+        response = client.post(
+            f"/api/groups/{group_id}/members/bulk",
+            json={"user_ids": [new_id, member_id, new_id, 99999]},
+            headers=authenticated_user["headers"],
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        # Duplicates in the request are collapsed, order is preserved
+        assert data["added_user_ids"] == [new_id]
+        assert data["skipped_user_ids"] == [member_id, 99999]
+
+        # Repeating the request adds nothing and leaves one row per member
+        response = client.post(
+            f"/api/groups/{group_id}/members/bulk",
+            json={"user_ids": [new_id]},
+            headers=authenticated_user["headers"],
+        )
+        assert response.json()["added_user_ids"] == []
+        assert response.json()["skipped_user_ids"] == [new_id]
+
+    @pytest.mark.asyncio
+    async def test_bulk_add_rejects_more_than_1000_users(
+        self, setup_database, authenticated_user
+    ):
+        """Test that the batch size is capped at 1000 users."""
+        group_id, _ = await self._create_group_with_users(
+            authenticated_user["user"].id, []
+        )
+
+        response = client.post(
+            f"/api/groups/{group_id}/members/bulk",
+            json={"user_ids": list(range(1, 1002))},
+            headers=authenticated_user["headers"],
+        )
+
+        assert response.status_code == 422
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -243,6 +243,118 @@ class TestSecurityMiddleware:
         )
 
 
+class TestAuthCaches:
+    """Test the per-worker authentication caches and their invalidation."""
+
+    def setup_method(self):
+        from src.auth.dependencies import (
+            admin_user_cache,
+            token_user_cache,
+            user_snapshot_cache,
+        )
+
+        admin_user_cache.clear()
+        token_user_cache.clear()
+        user_snapshot_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_deactivation_drops_cached_user(self, mock_user):
+        """Test that deactivating a user makes their cached tokens miss."""
+        from src.api.auth import deactivate_user
+        from src.auth.dependencies import _cache_user, _get_cached_user_id
+
+        _cache_user("token-key", mock_user)
+        assert _get_cached_user_id("token-key") == mock_user.id
+
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = mock_user
+        db = AsyncMock()
+        db.execute.return_value = result
+        # Record whether the snapshot was still cached when the change committed
+        cached_at_commit = []
+        db.commit.side_effect = lambda: cached_at_commit.append(
+            _get_cached_user_id("token-key")
+        )
+        admin = User(id=2, username="admin", email="admin@example.com")
+
+        with patch("src.api.auth.UserResponse.model_validate"):
+            await deactivate_user(user_id=mock_user.id, current_user=admin, db=db)
+
+        assert mock_user.is_active is False
+        # Invalidated only after the commit, so no request can re-cache the
+        # old row in between
+        assert cached_at_commit == [mock_user.id]
+        assert _get_cached_user_id("token-key") is None
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_returns_session_bound_user(self, mock_user):
+        """Test that a cached user is attached to the request's session."""
+        from sqlalchemy import inspect
+        from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+        from src.auth.dependencies import _cache_user, _get_cached_user
+
+        _cache_user("token-key", mock_user)
+
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with AsyncSession(engine) as session:
+            user = await _get_cached_user(session, "token-key")
+
+            assert user is not None
+            assert user is not mock_user
+            assert inspect(user).persistent
+            assert user in session
+            assert user.username == mock_user.username
+
+            # Handlers can modify the user and have the change flushed
+            user.full_name = "Renamed User"
+            assert user in session.dirty
+        await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_admin_demotion_clears_admin_cache(self):
+        """Test that revoking admin status drops every cached admin check."""
+        from datetime import datetime, timezone
+        from src.api.admin import update_user
+        from src.auth.dependencies import admin_user_cache
+        from src.schemas.admin import UserUpdateRequest
+
+        admin = User(id=1, username="admin", email="admin@example.com")
+        demoted = User(
+            id=2,
+            username="other",
+            email="other@example.com",
+            is_active=True,
+            is_admin=True,
+            is_verified=True,
+            created_at=datetime.now(timezone.utc),
+        )
+        admin_user_cache.set("admin-token-key", admin)
+        admin_user_cache.set("demoted-token-key", demoted)
+
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = demoted
+        result.scalar.return_value = 0
+        db = AsyncMock()
+        db.execute.return_value = result
+        cached_at_commit = []
+        db.commit.side_effect = lambda: cached_at_commit.append(
+            len(admin_user_cache)
+        )
+
+        await update_user(
+            user_id=demoted.id,
+            update_data=UserUpdateRequest(is_admin=False),
+            db=db,
+            admin_user=admin,
+        )
+
+        assert demoted.is_admin is False
+        # Cleared only after the demotion committed
+        assert cached_at_commit == [2]
+        assert admin_user_cache.get("demoted-token-key") is None
+        assert len(admin_user_cache) == 0
+
+
 class TestPasswordSecurity:
     """Test password hashing and validation."""
 
@@ -65,6 +65,37 @@ class TestPasswordSecurity:
         user = User(username="test", email="test@example.com")
         assert user.verify_password("anypassword") is False
 
+    def test_new_hashes_use_argon2id_and_bcrypt_is_upgraded(self):
+        """Test that new hashes are Argon2id and legacy bcrypt hashes still verify."""
+        from passlib.hash import bcrypt
+        from src.models.user import pwd_context
+
+        assert pwd_context.hash("testpassword123").startswith("$argon2id$")
+
+        legacy = bcrypt.hash("testpassword123")
+        assert pwd_context.verify("testpassword123", legacy) is True
+        assert pwd_context.needs_update(legacy) is True
+
+    def test_password_cache_only_remembers_matching_pairs(self):
+        """Test the verification cache is keyed by hash and password and expires."""
+        from src.auth.password_cache import PasswordVerificationCache
+
+        cache = PasswordVerificationCache(maxsize=2, ttl=60)
+        cache.add("hash-a", "secret")
+
+        assert cache.contains("hash-a", "secret") is True
+        assert cache.contains("hash-a", "other") is False
+        assert cache.contains("hash-b", "secret") is False
+
+        # Oldest entry is evicted once the cache is full
+        cache.add("hash-b", "secret")
+        cache.add("hash-c", "secret")
+        assert cache.contains("hash-a", "secret") is False
+
+        expired = PasswordVerificationCache(ttl=-1)
+        expired.add("hash-a", "secret")
+        assert expired.contains("hash-a", "secret") is False
+
 
 class TestConfigurationSecurity:
     """Test security configuration validation."""
@@ -123,6 +154,71 @@ class TestSecurityMiddleware:
         assert "GET" in middleware.SAFE_METHODS
         assert "POST" not in middleware.SAFE_METHODS
 
+    @patch("src.middleware.security.settings.login_rate_limit_per_minute", 1)
+    @patch("src.middleware.security.settings.login_rate_limit_burst", 2)
+    def test_token_bucket_rejects_after_burst(self):
+        """Test that the token bucket allows the burst then rejects."""
+        from src.middleware.security import TokenBucketRateLimiter
+
+        limiter = TokenBucketRateLimiter(
+            "login", "login_rate_limit_per_minute", "login_rate_limit_burst"
+        )
+        assert limiter._take_token("1.2.3.4") is True
+        assert limiter._take_token("1.2.3.4") is True
+        assert limiter._take_token("1.2.3.4") is False
+
+        # Buckets are tracked per client
+        assert limiter._take_token("5.6.7.8") is True
+
+    @patch("src.middleware.security.settings.login_rate_limit_per_minute", 1)
+    @patch("src.middleware.security.settings.login_rate_limit_burst", 2)
+    def test_token_bucket_storage_is_bounded(self):
+        """Test that idle buckets are evicted instead of growing forever."""
+        from src.middleware.security import TokenBucketRateLimiter
+
+        limiter = TokenBucketRateLimiter(
+            "login", "login_rate_limit_per_minute", "login_rate_limit_burst"
+        )
+        limiter.buckets.maxsize = 3
+        for i in range(10):
+            assert limiter._take_token(f"10.0.0.{i}") is True
+
+        assert len(limiter.buckets) == 3
+        # Two minutes to refill a burst of two at one token per minute
+        assert limiter.buckets.ttl == 120
+
+
+    @staticmethod
+    def _request(peer, headers):
+        from types import SimpleNamespace
+
+        return SimpleNamespace(client=SimpleNamespace(host=peer), headers=headers)
+
+    @patch("src.middleware.security.settings.trusted_proxies", [])
+    def test_client_ip_ignores_forwarded_headers_from_clients(self):
+        """Test that a client cannot choose its address via X-Forwarded-For."""
+        from src.middleware.security import get_client_ip
+
+        request = self._request(
+            "203.0.113.7", {"X-Forwarded-For": "1.2.3.4", "X-Real-IP": "5.6.7.8"}
+        )
+        assert get_client_ip(request) == "203.0.113.7"
+
+    @patch("src.middleware.security.settings.trusted_proxies", ["10.0.0.0/8"])
+    def test_client_ip_uses_forwarded_for_behind_trusted_proxy(self):
+        """Test that the rightmost untrusted X-Forwarded-For hop is the client."""
+        from src.middleware.security import get_client_ip
+
+        # The client prepended a forged entry; the proxy appended the real one
+        request = self._request(
+            "10.0.0.2", {"X-Forwarded-For": "1.2.3.4, 198.51.100.9, 10.0.0.3"}
+        )
+        assert get_client_ip(request) == "198.51.100.9"
+
+        # Untrusted peers are still taken at face value
+        request = self._request("203.0.113.7", {"X-Forwarded-For": "1.2.3.4"})
+        assert get_client_ip(request) == "203.0.113.7"
+
 
 class TestDatabaseFallback:
     """Test database fallback mechanism."""